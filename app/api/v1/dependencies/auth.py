@@ -4,7 +4,8 @@ from app.services.auth_service import verify_api_key
 from app.core.supabase_connect import get_supabase
 from app.core.redis_connect import get_redis
 from app.services.redis_service import RedisService
-import redis
+import redis.asyncio as redis
+from typing import Dict, Optional
 
 redis_service = RedisService()
 
@@ -32,5 +33,10 @@ async def require_user(request: Request, supabase: AsyncClient = Depends(get_sup
         return res
     except Exception as e:
         raise HTTPException(status_code=403, detail=f"토큰 검증 실패: {str(e)}")
-    
-    
\ No newline at end of file
+
+async def get_user_cache_context(user_id: str = Depends(require_user), redis: redis.Redis = Depends(get_redis)) -> Dict[str, Optional[str]]:
+    """
+    사용자별 Redis 캐시 값(워크스페이스 ID, 노션 토큰)을 한 번에 조회
+    - FastAPI는 요청 안에서 같은 의존성 결과를 재사용하므로, 워크스페이스/노션 의존성이 함께 쓰여도 Redis 왕복은 1회
+    """
+    return await redis_service.get_user_context(user_id, redis)
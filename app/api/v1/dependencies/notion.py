@@ -4,9 +4,9 @@ from app.services.redis_service import RedisService
 from app.core.supabase_connect import get_supabase
 from supabase._async.client import AsyncClient
 from app.services.notion_service import NotionService
-from app.api.v1.dependencies.auth import require_user
+from app.api.v1.dependencies.auth import require_user, get_user_cache_context
 from app.utils.logger import api_logger
-import redis
+import redis.asyncio as redis
 from app.services.auth_service import get_integration_token
 from app.services.supa import get_default_workspace,list_all_learning_databases
 
@@ -16,12 +16,13 @@ redis_service = RedisService()
 async def get_notion_service(
     user_id: str = Depends(require_user), 
     supabase: AsyncClient = Depends(get_supabase),
-    redis: redis.Redis = Depends(get_redis)
+    redis: redis.Redis = Depends(get_redis),
+    user_context: dict = Depends(get_user_cache_context)
 ):
     """노션 서비스 객체 생성 - 연동이 안 되어 있으면 예외 발생"""
     try:
-        # 먼저 Redis에서 토큰 조회 시도
-        token = await redis_service.get_token(user_id, "notion", redis)
+        # 먼저 Redis에서 조회해 둔 토큰 사용 (워크스페이스 ID와 함께 한 번에 조회)
+        token = user_context["notion_token"]
         
         # Redis에 토큰이 없으면 Supabase에서 조회 후 Redis에 저장
         if token is None:
@@ -50,13 +51,13 @@ async def get_notion_service(
             detail="노션 연동 상태 확인 중 오류가 발생했습니다."
         )
         
-    return NotionService(token=token)
+    return NotionService(token=token, redis_client=redis)
 
-async def get_notion_workspace(user_id: str = Depends(require_user), supabase: AsyncClient = Depends(get_supabase), redis: redis.Redis = Depends(get_redis)) -> str:
+async def get_notion_workspace(user_id: str = Depends(require_user), supabase: AsyncClient = Depends(get_supabase), redis: redis.Redis = Depends(get_redis), user_context: dict = Depends(get_user_cache_context)) -> str:
     """기본 노션 워크스페이스 조회"""
     try:        
         # Redis에 저장된 워크스페이스 id 조회
-        workspace_id = await redis_service.get_user_workspace(user_id, redis)
+        workspace_id = user_context["workspace_id"]
         if workspace_id:
             return workspace_id
         
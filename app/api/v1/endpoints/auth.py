@@ -116,7 +116,6 @@ async def initiate_oauth(provider: str, user_id: str = Depends(require_user), re
     try:
         # state_uuid 생성
         state_uuid = await redis_service.set_state_uuid(user_id, redis)
-        print(state_uuid + "생성")
         # state 파라미터 생성 (검증용)
         state_param = f"user_id={user_id}|uuid={state_uuid}"
         
@@ -153,7 +152,6 @@ async def token_callback_get(provider: str, code: str = Query(...), state: str =
     try:
         # 1. state 파싱
         user_id, state_uuid = parse_oauth_state(state)
-        print(user_id, state_uuid)
         if not user_id or not state_uuid:
             raise HTTPException(status_code=401, detail="인증 정보 없음")
         
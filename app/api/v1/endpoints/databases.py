@@ -18,7 +18,6 @@ from app.utils.logger import api_logger
 from app.services.supa import (
     list_all_learning_databases,
     update_learning_database_status,
-    get_active_learning_database,
     insert_learning_database,
     get_db_info_by_id,
     update_learning_database
@@ -32,7 +31,7 @@ from app.api.v1.dependencies.notion import get_notion_service
 from app.services.redis_service import RedisService
 from app.core.redis_connect import get_redis
 from app.services.workspace_cache_service import workspace_cache_service
-import redis
+import redis.asyncio as redis
 
 router = APIRouter()
 redis_service = RedisService()
@@ -9,7 +9,8 @@ from app.utils.logger import api_logger
 from app.utils.github_webhook_helper import GithubWebhookHelper
 from app.api.v1.handler.github_webhook_handler import GitHubWebhookHandler
 from app.core.redis_connect import get_redis
-import redis
+import redis.asyncio as redis
+from app.services import redis_keys
 
 router = APIRouter()
 public_router = APIRouter()
@@ -66,8 +67,8 @@ async def create_webhook(
 
     # 4) Redis에 레포별 DB ID 저장 (실패해도 웹훅 등록은 성공으로 처리)
     try:
-        redis_key = f"user:{user_id}:{repo_name}:db_id"
-        redis_client.setex(redis_key, 3600 * 24 * 7, learning_db_id)  # 7일 보관
+        redis_key = redis_keys.repo_db_id(user_id, repo_name)
+        await redis_client.setex(redis_key, 3600 * 24 * 7, learning_db_id)  # 7일 보관
         api_logger.info(f"Redis 키 저장 완료: {redis_key} -> {learning_db_id}")
     except Exception as e:
         api_logger.error(f"Redis 저장 실패: {e}")
@@ -1,8 +1,8 @@
-from fastapi import APIRouter, Response, HTTPException
+from fastapi import APIRouter, Response, HTTPException, Depends
 from app.services.code_analysis_service import CodeAnalysisService
-from app.core.config import settings
 from app.utils.logger import api_logger
-from redis import Redis
+import redis.asyncio as redis
+from app.core.redis_connect import get_redis
 import asyncio
 import traceback
 from typing import Dict, Any
@@ -17,17 +17,11 @@ async def basic_health_check():
     return {"status": "ok", "service": "notion-learning-api"}
 
 @router.get("/healthz")
-async def health_check():
+async def health_check(redis_client: redis.Redis = Depends(get_redis)):
     """기본 헬스체크 (Redis 연결 체크(RQ서버))"""
     try:
-        # Redis 연결 확인
-        redis_client = Redis(
-            host=settings.REDIS_HOST,
-            port=settings.REDIS_PORT,
-            password=settings.REDIS_PASSWORD,
-            decode_responses=False
-        )
-        redis_client.ping()
+        # Redis 연결 확인 (앱 공용 비동기 클라이언트 재사용)
+        await redis_client.ping()
         
         return {"status": "ok", "timestamp": asyncio.get_event_loop().time()}
     except Exception as e:
@@ -35,17 +29,11 @@ async def health_check():
         return Response(status_code=500, content=f"error: {e}")
 
 @router.get("/health/ready")  
-async def readiness_check():
+async def readiness_check(redis_client: redis.Redis = Depends(get_redis)):
     """준비 상태 확인 (Kubernetes Readiness Probe용)"""
     try:
-        # Redis 연결 확인
-        redis_client = Redis(
-            host=settings.REDIS_HOST,
-            port=settings.REDIS_PORT,
-            password=settings.REDIS_PASSWORD,
-            decode_responses=False
-        )
-        redis_client.ping()
+        # Redis 연결 확인 (앱 공용 비동기 클라이언트 재사용)
+        await redis_client.ping()
         
         # 공유 ThreadPoolExecutor 상태 확인
         executor_status = "ready" if CodeAnalysisService._shared_executor else "not_initialized"
@@ -61,7 +49,7 @@ async def readiness_check():
         return Response(status_code=503, content=f"not ready: {e}")
 
 @router.get("/health/detailed")
-async def detailed_health_check() -> Dict[str, Any]:
+async def detailed_health_check(redis_client: redis.Redis = Depends(get_redis)) -> Dict[str, Any]:
     """상세 헬스체크 (운영 모니터링용)"""
     health_status = {
         "status": "healthy",
@@ -71,14 +59,7 @@ async def detailed_health_check() -> Dict[str, Any]:
     
     try:
         # Redis 상태 확인
-        redis_client = Redis(
-            host=settings.REDIS_HOST,
-            port=settings.REDIS_PORT,
-            password=settings.REDIS_PASSWORD,
-            decode_responses=False
-        )
-        
-        redis_info = redis_client.info("memory")
+        redis_info = await redis_client.info("memory")
         health_status["components"]["redis"] = {
             "status": "healthy",
             "used_memory_mb": round(int(redis_info.get("used_memory", 0)) / 1024 / 1024, 2),
@@ -116,17 +97,10 @@ async def detailed_health_check() -> Dict[str, Any]:
         return health_status
 
 @router.get("/health/metrics")
-async def prometheus_metrics():
+async def prometheus_metrics(redis_client: redis.Redis = Depends(get_redis)):
     """Prometheus 메트릭 (모니터링 시스템용)"""
     try:
-        redis_client = Redis(
-            host=settings.REDIS_HOST,
-            port=settings.REDIS_PORT,
-            password=settings.REDIS_PASSWORD,
-            decode_responses=False
-        )
-        
-        redis_info = redis_client.info("memory")
+        redis_info = await redis_client.info("memory")
         
         metrics = []
         metrics.append(f"rq_worker_redis_memory_bytes {redis_info.get('used_memory', 0)}")
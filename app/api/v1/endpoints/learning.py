@@ -1,6 +1,8 @@
 """
 학습 DB의 하위 페이지 관련 API 엔드포인트
 """
+import time
+import hashlib
 from fastapi import APIRouter, HTTPException
 from fastapi.encoders import jsonable_encoder
 from app.services.notion_service import NotionService
@@ -21,7 +23,7 @@ from app.utils.notion_utils import(
     block_content,
     serialize_page_props
 )
-import redis
+import redis.asyncio as redis
 from app.core.supabase_connect import get_supabase
 from supabase._async.client import AsyncClient
 from fastapi import Depends
@@ -76,21 +78,23 @@ async def create_pages(req: LearningPagesRequest, workspace_id: str = Depends(ge
         # 유효하지 않은 DB ID (사용자 실수)
         raise HTTPException(status_code=400, detail="학습 페이지 생성 실패: 유효한 DB가 아닙니다.")
     
-    results = []
+    # 멱등성 키 생성 (요청별 고유)
+    request_timestamp = int(time.time() * 1000)  # 밀리초 단위
+    idempotency_keys = [
+        hashlib.md5(f"{notion_db_id}_{plan.title}_{plan.date.isoformat()}_{i}_{request_timestamp}".encode()).hexdigest()[:12]
+        for i, plan in enumerate(req.plans)
+    ]
+    api_logger.info(f"페이지 일괄 생성 시작 - {len(req.plans)}개, 멱등성 키: {idempotency_keys}")
+
+    # 노션 페이지는 동시에 생성하고, 결과는 요청 순서대로 메타 저장
+    created = await notion_service.create_learning_pages(notion_db_id, req.plans, idempotency_keys)
 
-    for i, plan in enumerate(req.plans):
+    results = []
+    for i, (plan, idempotency_key, outcome) in enumerate(zip(req.plans, idempotency_keys, created)):
         try:
-            # 멱등성 키 생성 (요청별 고유)
-            import time
-            import hashlib
-            request_timestamp = int(time.time() * 1000)  # 밀리초 단위
-            content_for_hash = f"{notion_db_id}_{plan.title}_{plan.date.isoformat()}_{i}_{request_timestamp}"
-            idempotency_key = hashlib.md5(content_for_hash.encode()).hexdigest()[:12]
-            
-            api_logger.info(f"페이지 생성 시작 - 순번: {i+1}/{len(req.plans)}, 멱등성 키: {idempotency_key}")
-            
-            # 새로운 학습 행 생성
-            page_id, ai_block_id = await notion_service.create_learning_page(notion_db_id, plan, idempotency_key)
+            if isinstance(outcome, Exception):
+                raise outcome
+            page_id, ai_block_id = outcome
             
             # 생성된 학습 행에 대한 메타 저장
             saved = await insert_learning_page(
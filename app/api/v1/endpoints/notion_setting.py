@@ -1,6 +1,6 @@
 from fastapi import APIRouter, Depends, HTTPException
 from supabase._async.client import AsyncClient
-from redis import Redis
+from redis.asyncio import Redis
 from app.core.supabase_connect import get_supabase
 from app.core.redis_connect import get_redis
 from app.api.v1.dependencies.auth import require_user
@@ -53,11 +53,8 @@ async def get_top_level_pages(
     if top_pages:
         return {"status": "success", "data": {"pages": top_pages}, "message": "워크스페이스 페이지 목록 조회 성공", "source": "cache"}
     
-    print(top_pages)
     top_pages = await notion_service.get_workspace_top_pages()
-    print(top_pages)
     await redis_service.set_workspace_pages(user_id, workspace_id, top_pages, redis)
-    print("완료")
     return {"status": "success", "data": {"pages": top_pages}, "message": "워크스페이스 페이지 목록 조회 성공", "source": "api"}
 
 @router.get("/set-top-page/{page_id}")
@@ -8,7 +8,7 @@ from supabase._async.client import AsyncClient
 import hmac
 import hashlib
 import json
-import redis
+import redis.asyncio as redis
 from app.core.config import settings
 
 router = APIRouter()
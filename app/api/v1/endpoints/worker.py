@@ -1,13 +1,17 @@
 from fastapi import APIRouter, Depends
 from app.utils.logger import api_logger
-from app.core.redis_connect import get_redis
 from worker.monitor import get_queue_stats, get_detailed_queue_info, get_worker_health
+from worker.tasks import task_queue
 import redis
 
 router = APIRouter()
 
+def get_queue_redis() -> redis.Redis:
+    """RQ 모니터링용 동기 Redis 연결 (RQ는 동기 클라이언트만 지원하므로 app.state.redis 대신 큐 연결 사용)"""
+    return task_queue.connection
+
 @router.get("/health")
-async def worker_health_check(redis_client: redis.Redis = Depends(get_redis)):
+async def worker_health_check(redis_client: redis.Redis = Depends(get_queue_redis)):
     """워커 상태 체크"""
     health_data = get_worker_health(redis_client)
     
@@ -18,7 +22,7 @@ async def worker_health_check(redis_client: redis.Redis = Depends(get_redis)):
     }
 
 @router.get("/queue/stats")
-async def get_queue_statistics(redis_client: redis.Redis = Depends(get_redis)):
+async def get_queue_statistics(redis_client: redis.Redis = Depends(get_queue_redis)):
     """RQ 큐 통계 조회"""
     stats = get_queue_stats(redis_client)
     
@@ -29,7 +33,7 @@ async def get_queue_statistics(redis_client: redis.Redis = Depends(get_redis)):
     }
 
 @router.get("/queue/details")
-async def get_queue_details(redis_client: redis.Redis = Depends(get_redis)):
+async def get_queue_details(redis_client: redis.Redis = Depends(get_queue_redis)):
     """RQ 큐 상세 정보 조회"""
     details = get_detailed_queue_info(redis_client)
     
@@ -40,7 +44,7 @@ async def get_queue_details(redis_client: redis.Redis = Depends(get_redis)):
     }
 
 @router.get("/monitor")
-async def get_full_monitor_info(redis_client: redis.Redis = Depends(get_redis)):
+async def get_full_monitor_info(redis_client: redis.Redis = Depends(get_queue_redis)):
     """전체 모니터링 정보 조회"""
     stats = get_queue_stats(redis_client)
     details = get_detailed_queue_info(redis_client)
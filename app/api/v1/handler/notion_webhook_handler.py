@@ -9,13 +9,12 @@ from app.services.supa import (
     delete_learning_page_by_system_id,
     clear_ai_block_id,
     delete_learning_database_by_system_id,
-    log_webhook_operation,
-    update_webhook_operation_status
+    log_webhook_operation
 )
 from supabase._async.client import AsyncClient
 from typing import Dict, Any
 import json
-import redis
+import redis.asyncio as redis
 from datetime import datetime
 
 class NotionWebhookHandler:
@@ -25,7 +24,10 @@ class NotionWebhookHandler:
         self.redis_service = RedisService()
     
     async def process_webhook_event(self, payload: dict, supabase: AsyncClient, redis_client: redis.Redis):
-        """웹훅 이벤트 처리 로직"""
+        """
+        웹훅 이벤트 처리 로직
+        - 작업 로그는 처리 결과(success/failed)와 함께 마지막에 한 번만 기록 (pending 기록 + 상태 갱신 2회 왕복 대신)
+        """
         operation_log = None
         try:
             workspace_id = payload.get("workspace_id")
@@ -64,8 +66,7 @@ class NotionWebhookHandler:
             entity_type = entity_info.get("type")
             should_log = entity_type in ["learning_page", "ai_block", "database"]
             
-            # 웹훅 작업 로깅 (실제 DB 변경 대상만)
-            operation_log = None
+            # 웹훅 작업 로깅 대상 (실제 DB 변경 대상만)
             if should_log:
                 db_id = entity_info.get("db_id")
                 if db_id:
@@ -78,14 +79,12 @@ class NotionWebhookHandler:
                     }
                     operation_type = operation_type_map.get(event_type, "verify")
                     
-                    operation_log = await log_webhook_operation(
-                        db_id=db_id,
-                        operation_type=operation_type,
-                        status="pending",
-                        supabase=supabase,
-                        payload=payload,  # 원본 Notion 웹훅 데이터 저장
-                        webhook_id=None  # Notion 웹훅은 webhook_id가 별도로 없음
-                    )
+                    operation_log = {
+                        "db_id": db_id,
+                        "operation_type": operation_type,
+                        "payload": payload,  # 원본 Notion 웹훅 데이터 저장
+                        "webhook_id": None  # Notion 웹훅은 webhook_id가 별도로 없음
+                    }
             else:
                 api_logger.info(f"DB 변경 없는 이벤트로 로깅 스킵: {entity_type}")
             
@@ -106,33 +105,19 @@ class NotionWebhookHandler:
             await workspace_cache_service.invalidate_workspace_cache(workspace_id, redis_client)
             api_logger.info(f"이벤트 처리 완료 및 캐시 무효화: {event_type} - {entity_info['type']}")
             
-            # 성공 시 작업 상태 업데이트
+            # 성공 시 작업 로그 기록
             if operation_log:
-                await update_webhook_operation_status(
-                    operation_log["id"],
-                    "success",
-                    supabase
-                )
+                await log_webhook_operation(status="success", supabase=supabase, **operation_log)
             
         except (DatabaseError, RedisError, ValidationError) as e:
-            # 실패 시 작업 상태 업데이트
+            # 실패 시 작업 로그 기록
             if operation_log:
-                await update_webhook_operation_status(
-                    operation_log["id"],
-                    "failed",
-                    supabase,
-                    error_message=str(e)
-                )
+                await log_webhook_operation(status="failed", supabase=supabase, error_message=str(e), **operation_log)
             raise
         except Exception as e:
-            # 예상치 못한 오류 시 작업 상태 업데이트
+            # 예상치 못한 오류 시 작업 로그 기록
             if operation_log:
-                await update_webhook_operation_status(
-                    operation_log["id"],
-                    "failed",
-                    supabase,
-                    error_message=str(e)
-                )
+                await log_webhook_operation(status="failed", supabase=supabase, error_message=str(e), **operation_log)
             api_logger.error(f"웹훅 이벤트 처리 중 예상치 못한 오류: {str(e)}")
             raise WebhookError(f"웹훅 이벤트 처리 실패: {str(e)}")
     
@@ -42,6 +42,11 @@ class Settings(BaseSettings):
     NOTION_CLIENT_ID: str
     NOTION_CLIENT_SECRET: str
     NOTION_WEBHOOK_SECRET: str
+    NOTION_MAX_CONCURRENCY: int = 5  # 서비스 인스턴스당 동시 Notion 요청 수 (rate limit 429 방지)
+    NOTION_RATE_LIMIT_PER_SECOND: float = 3.0  # 통합 토큰당 초당 평균 Notion 요청 수 (Notion 공식 제한)
+    NOTION_RATE_LIMIT_BURST: int = 3  # 통합 토큰당 한 번에 몰아서 보낼 수 있는 요청 수
+    NOTION_HTTP_MAX_CONNECTIONS: int = 20  # 공용 Notion HTTP 클라이언트 커넥션 풀 크기
+    NOTION_HTTP_MAX_KEEPALIVE: int = 20  # 유휴 상태로 유지할 keep-alive 커넥션 수
 
     # Supabase 설정
     SUPABASE_URL: str
@@ -55,6 +60,7 @@ class Settings(BaseSettings):
     REDIS_HOST: str
     REDIS_PORT: str
     REDIS_PASSWORD: str
+    REDIS_MAX_CONNECTIONS: int = 50  # API 프로세스 공용 Redis 커넥션 풀 크기
 
     # GitHub OAuth
     GITHUB_CLIENT_ID: str
@@ -4,6 +4,7 @@ from app.core.supabase_connect import init_supabase
 from app.utils.logger import api_logger
 from app.core.redis_connect import init_redis_client
 from app.core.config import settings
+from app.services.notion_service import close_http_client as close_notion_http_client
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -27,8 +28,11 @@ async def lifespan(app: FastAPI):
                 api_logger.info("Supabase 클라이언트 정리 완료")
 
             if hasattr(app.state, "redis"):
-                app.state.redis.close()
+                await app.state.redis.aclose()
                 api_logger.info("Redis 클라이언트 정리 완료")
+
+            await close_notion_http_client()
+            api_logger.info("Notion HTTP 클라이언트 정리 완료")
         except Exception as e:
             api_logger.error(f"Supabase 클라이언트 정리 실패: {str(e)}")
             api_logger.error(f"Redis 클라이언트 정리 실패: {str(e)}")
\ No newline at end of file
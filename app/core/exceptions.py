@@ -6,6 +6,18 @@ class NotionAPIError(Exception):
     def __init__(self, detail: str):
         super().__init__(f"Notion API Error: {detail}")
 
+class NotionClientError(NotionAPIError):
+    """재시도해도 결과가 같은 Notion 4xx 오류 (429 제외)"""
+    def __init__(self, detail: str, status_code: int):
+        self.status_code = status_code
+        super().__init__(detail)
+
+class RateLimitedError(NotionAPIError):
+    """Notion 429 응답 (retry_after: Retry-After 헤더의 대기 시간(초), 없으면 None)"""
+    def __init__(self, detail: str, retry_after: float | None = None):
+        self.retry_after = retry_after
+        super().__init__(detail)
+
 class DatabaseError(Exception):
     def __init__(self, detail: str):
         super().__init__(f"Database Error: {detail}")
@@ -1,17 +1,40 @@
-import redis
+import redis.asyncio as redis
+from redis.asyncio.retry import Retry
+from redis.backoff import ExponentialBackoff
+from redis.exceptions import BusyLoadingError
+from redis.utils import HIREDIS_AVAILABLE
 from fastapi import Request
 from app.core.config import settings
+from app.utils.logger import api_logger
 
 async def init_redis_client() -> redis.Redis:
     try:
-        client = redis.Redis(
+        # 프로세스 전체에서 공유하는 커넥션 풀 (요청마다 연결/인증을 반복하지 않음)
+        # - 풀이 가득 차면 오류 대신 반환될 때까지 대기 (최대 5초)
+        pool = redis.BlockingConnectionPool(
             host=(settings.REDIS_HOST),
             port=int(settings.REDIS_PORT),
             password=(settings.REDIS_PASSWORD),
             decode_responses=True,
             username="default",
+            # RESP3 프로토콜 사용 (hiredis가 설치되어 있으면 C 파서로 응답 파싱)
+            protocol=3,
+            max_connections=settings.REDIS_MAX_CONNECTIONS,
+            timeout=5,
+            # 유휴 상태로 끊긴 소켓을 요청 시점 오류 대신 미리 감지해 재연결
+            health_check_interval=30,
+            socket_keepalive=True,
+            # 연결/타임아웃 같은 일시적 오류만 커넥션 계층에서 재시도 (50ms부터 최대 1초까지 지수 백오프, 3회)
+            retry=Retry(ExponentialBackoff(cap=1.0, base=0.05), retries=3),
+            retry_on_error=[redis.ConnectionError, redis.TimeoutError, BusyLoadingError],
         )
-        return client
+        # redis-py는 hiredis가 설치되어 있으면 자동으로 C 파서를 선택 (없으면 순수 파이썬 파서)
+        if HIREDIS_AVAILABLE:
+            api_logger.info("Redis 응답 파서: hiredis (RESP3)")
+        else:
+            api_logger.warning("hiredis 미설치 - 순수 파이썬 Redis 파서 사용 (requirements.txt 확인 필요)")
+        # from_pool: 클라이언트가 풀을 소유하므로 종료 시 aclose()로 풀까지 정리
+        return redis.Redis.from_pool(pool)
     except Exception as e:
         raise e
 
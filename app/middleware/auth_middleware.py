@@ -9,7 +9,7 @@ from app.services.auth_service import verify_api_key
 from app.core.redis_connect import get_redis
 from app.services.redis_service import RedisService
 from app.utils.logger import api_logger
-import redis
+import redis.asyncio as redis
 
 redis_service = RedisService()
 
@@ -11,6 +11,7 @@ import sys
 import os
 from openai import OpenAI
 from app.services.redis_service import RedisService
+from app.services import redis_keys
 from app.services.extract_for_file_service import extract_functions_by_type
 from app.services.notion_service import NotionService
 from app.services.auth_service import get_integration_token
@@ -20,6 +21,27 @@ from app.core.config import settings
 # 버퍼링 비활성화
 os.environ["PYTHONUNBUFFERED"] = "1"
 import concurrent.futures
+import zlib
+
+# 함수 요약 Redis 저장 압축 (LLM 요약은 수 KB 텍스트라 압축률이 높음)
+# - 압축한 값은 _COMPRESSED_PREFIX로 구분하고, 작은 값과 기존에 저장된 평문 값은 그대로 읽음
+_COMPRESSED_PREFIX = b"\x02"
+_COMPRESS_MIN_BYTES = 256
+
+def _pack_summary(summary: str) -> bytes:
+    """요약 문자열을 Redis 저장용 bytes로 변환 (일정 크기 이상이면 zlib 압축)"""
+    raw = summary.encode("utf-8")
+    if len(raw) < _COMPRESS_MIN_BYTES:
+        return raw
+    return _COMPRESSED_PREFIX + zlib.compress(raw, 6)
+
+def _unpack_summary(value: Optional[bytes | str]) -> Optional[str]:
+    """Redis에서 읽은 요약 값을 문자열로 복원 (압축/평문/str 모두 처리)"""
+    if value is None or isinstance(value, str):
+        return value
+    if value.startswith(_COMPRESSED_PREFIX):
+        return zlib.decompress(value[1:]).decode("utf-8")
+    return value.decode("utf-8")
 
 class CodeAnalysisService:
     """함수 중심 코드 분석 및 LLM 처리 서비스 - 24/7 운영 최적화 버전"""
@@ -61,12 +83,15 @@ class CodeAnalysisService:
     async def _save_function_summary_to_hash(self, user_id: str, commit_sha: str, 
                                            filename: str, func_name: str, summary: str):
         """함수 요약을 Hash 형태로 저장 (원자적 업데이트)"""
-        file_key = f"{user_id}:func:{commit_sha}:{filename}"
+        file_key = redis_keys.func_summaries(user_id, commit_sha, filename)
         
         def _sync_hash_save():
             try:
-                self.redis_client.hset(file_key, func_name, summary)
-                self.redis_client.expire(file_key, 86400 * 7)  # 7일 보관
+                # 저장과 만료 설정을 파이프라인으로 한 번에 전송 (1 RTT)
+                pipe = self.redis_client.pipeline(transaction=False)
+                pipe.hset(file_key, func_name, _pack_summary(summary))
+                pipe.expire(file_key, 86400 * 7)  # 7일 보관
+                pipe.execute()
                 return True
             except Exception as e:
                 api_logger.error(f"Redis Hash 저장 실패 ({func_name}): {e}")
@@ -86,7 +111,7 @@ class CodeAnalysisService:
     # ✅ Step 3: Hash에서 함수별 분석 결과 수집 (keys() 제거)
     async def _collect_function_summaries(self, user_id: str, filename: str, commit_sha: str) -> Dict[str, str]:
         """Hash에서 함수별 분석 결과 수집 (O(1) 조회)"""
-        file_key = f"{user_id}:func:{commit_sha}:{filename}"
+        file_key = redis_keys.func_summaries(user_id, commit_sha, filename)
         
         def _sync_hash_collect():
             try:
@@ -94,7 +119,7 @@ class CodeAnalysisService:
                 func_summaries = {}
                 for func_name_bytes, summary_bytes in summaries_hash.items():
                     func_name = func_name_bytes.decode('utf-8') if isinstance(func_name_bytes, bytes) else func_name_bytes
-                    summary = summary_bytes.decode('utf-8') if isinstance(summary_bytes, bytes) else summary_bytes
+                    summary = _unpack_summary(summary_bytes)
                     func_summaries[func_name] = summary
                 return func_summaries
             except Exception as e:
@@ -115,14 +140,14 @@ class CodeAnalysisService:
             return {}
     
     # ✅ Step 2,4: Redis 카운터 기반 pending 관리 (I/O 오프로드)
-    async def _increment_pending_count(self, user_id: str, commit_sha: str, filename: str):
-        """파일의 대기 중인 함수 수 증가 (commit_sha 포함, I/O 오프로드)"""
-        counter_key = f"{user_id}:pending:{commit_sha}:{filename}"
+    async def _increment_pending_count(self, user_id: str, commit_sha: str, filename: str, amount: int = 1):
+        """파일의 대기 중인 함수 수를 amount만큼 증가 (commit_sha 포함, I/O 오프로드)"""
+        counter_key = redis_keys.pending_count(user_id, commit_sha, filename)
         
         def _sync_incr():
             try:
                 pipe = self.redis_client.pipeline()
-                pipe.incr(counter_key)
+                pipe.incr(counter_key, amount)
                 pipe.expire(counter_key, 3600 * 3)  # 3시간 TTL
                 pipe.execute()
             except Exception as e:
@@ -141,7 +166,7 @@ class CodeAnalysisService:
     
     async def _decrement_pending_count(self, user_id: str, commit_sha: str, filename: str) -> int:
         """파일의 대기 중인 함수 수 감소 후 남은 수 반환 (I/O 오프로드)"""
-        counter_key = f"{user_id}:pending:{commit_sha}:{filename}"
+        counter_key = redis_keys.pending_count(user_id, commit_sha, filename)
         
         def _sync_decr():
             try:
@@ -202,17 +227,25 @@ class CodeAnalysisService:
             # 파일을 함수 단위로 분해
             functions = await self._extract_functions_from_file(file_content, filename, diff_info)
             
-            # 각 함수를 분석 큐에 추가
-            for func_info in functions:
-                # 새 파일 처리
-                if status == "added":
+            # 새 파일 처리
+            if status == "added":
+                for func_info in functions:
                     func_info['has_changes'] = False  # 변경사항 아님
                     func_info['changes'] = {}
                     func_info['is_new_file'] = True   # 새 파일 플래그
-                
+            
+            # 변경된 함수 + 새 파일 함수만 분석 대상
+            targets = [f for f in functions if f.get('has_changes', True) or f.get('is_new_file', False)]
+            
+            # ✅ Step 4: 파일 단위로 pending 카운터를 한 번에 증가 (함수마다 Redis 왕복하지 않음)
+            if targets:
+                await self._increment_pending_count(user_id, commit_sha, filename, len(targets))
+            
+            # 각 함수를 분석 큐에 추가
+            for func_info in targets:
                 await self._enqueue_function_analysis(func_info, commit_sha, user_id, owner, repo)
             
-            api_logger.info(f"파일 '{filename}': {len(functions)}개 함수중 {len([f for f in functions if f.get('has_changes', True) or f.get('is_new_file', False)])}개 변경된 함수 분석 큐에 추가")
+            api_logger.info(f"파일 '{filename}': {len(functions)}개 함수중 {len(targets)}개 변경된 함수 분석 큐에 추가")
         
         # ✅ Step 4: enqueue 완료 후 자동으로 큐 처리 트리거
         await self.process_queue()
@@ -302,40 +335,15 @@ class CodeAnalysisService:
         return await extract_functions_by_type(file_content, filename, diff_info)
         
     async def _enqueue_function_analysis(self, func_info: Dict, commit_sha: str, user_id: str, owner: str, repo: str):
-        """함수별 분석 작업을 큐에 추가 - 변경된 함수 + 새 파일 (Hash 캐시 확인)"""
+        """함수별 분석 작업을 큐에 추가 - 변경된 함수 + 새 파일 (pending 카운터는 호출부에서 파일 단위로 증가)"""
         
         # 변경사항도 없고 새 파일도 아니면 스킵
         if not func_info.get('has_changes', True) and not func_info.get('is_new_file', False): 
             api_logger.info(f"함수 '{func_info['name']}' 변경 없음")
             return
         
-        # ✅ Step 3: Hash 기반 캐시 확인 (개별 키 제거)
-        file_key = f"{user_id}:func:{commit_sha}:{func_info['filename']}"
-        
-        def _sync_cache_check():
-            try:
-                return self.redis_client.hget(file_key, func_info['name'])
-            except Exception as e:
-                api_logger.error(f"Redis Hash 캐시 확인 실패: {e}")
-                return None
-        
-        try:
-            executor = await self._get_shared_executor()
-            cached_result = await asyncio.get_event_loop().run_in_executor(executor, _sync_cache_check)
-        except Exception as e:
-            api_logger.error(f"캐시 확인 중 오류: {e}")
-            cached_result = None
-        
-        # 캐시가 있고 변경사항이 없는 기존 파일만 캐시 사용 (새 파일은 항상 분석)
-        if cached_result and not func_info.get('has_changes', True) and not func_info.get('is_new_file', False):
-            api_logger.info(f"함수 '{func_info['name']}' 변경 없음, 캐시 사용")
-            return
-        
         # 변경된 함수이거나 새 파일인 경우 큐에 추가
         if func_info.get('has_changes', True) or func_info.get('is_new_file', False):
-            # ✅ Step 4: pending 카운터 증가
-            await self._increment_pending_count(user_id, commit_sha, func_info['filename'])
-            
             analysis_item = {
                 'function_info': func_info,
                 'commit_sha': commit_sha,
@@ -431,7 +439,7 @@ class CodeAnalysisService:
         
         try:
             # ✅ Step 3: Hash에서 이전 분석 결과 조회 (개별 키 제거)
-            file_key = f"{user_id}:func:{commit_sha}:{filename}"
+            file_key = redis_keys.func_summaries(user_id, commit_sha, filename)
             
             def _sync_prev_check():
                 try:
@@ -442,7 +450,7 @@ class CodeAnalysisService:
             
             executor = await self._get_shared_executor()
             previous_summary_bytes = await asyncio.get_event_loop().run_in_executor(executor, _sync_prev_check)
-            previous_summary = previous_summary_bytes.decode('utf-8') if previous_summary_bytes else None
+            previous_summary = _unpack_summary(previous_summary_bytes) if previous_summary_bytes else None
         
             # 참조 파일 내용 가져오기
             reference_content = None
@@ -661,7 +669,7 @@ class CodeAnalysisService:
         # 파일에서 특정 함수가 지정되었는지 확인
         if '#' in reference_file:
             file_path, func_name = reference_file.split('#', 1)
-            file_key = f"{user_id}:func:{commit_sha}:{file_path}"
+            file_key = redis_keys.func_summaries(user_id, commit_sha, file_path)
             
             # ✅ Step 3: Hash에서 특정 함수 조회 (개별 키 제거)
             def _sync_ref_get():
@@ -675,13 +683,11 @@ class CodeAnalysisService:
                 executor = await self._get_shared_executor()
                 cached_content_bytes = await asyncio.get_event_loop().run_in_executor(executor, _sync_ref_get)
                 if cached_content_bytes:
-                    return cached_content_bytes.decode('utf-8') if isinstance(cached_content_bytes, bytes) else cached_content_bytes
+                    return _unpack_summary(cached_content_bytes)
             except Exception as e:
                 api_logger.error(f"참조 함수 조회 중 오류: {e}")
         else:
             # 파일 전체 참조인 경우 주요 함수들 조회
-            file_key = f"{user_id}:func:{commit_sha}:{reference_file}"
-            
             # ✅ Step 3: Hash 전체 조회 (keys() 제거)
             try:
                 func_summaries = await self._collect_function_summaries(user_id, reference_file, commit_sha)
@@ -780,13 +786,13 @@ class CodeAnalysisService:
         """파일 전체 흐름 분석 및 종합 요약 생성 (Step 1: Hash 기반)"""
         
         # ✅ Step 1: Hash에서 함수별 요약 수집 (keys() 제거)
-        file_key = f"{user_id}:func:{commit_sha}:{filename}"
+        file_key = redis_keys.func_summaries(user_id, commit_sha, filename)
         summaries_hash = self.redis_client.hgetall(file_key)
         
         function_summaries = {}
         for func_name_bytes, summary_bytes in summaries_hash.items():
             func_name = func_name_bytes.decode('utf-8') if isinstance(func_name_bytes, bytes) else func_name_bytes
-            summary = summary_bytes.decode('utf-8') if isinstance(summary_bytes, bytes) else summary_bytes
+            summary = _unpack_summary(summary_bytes)
             function_summaries[func_name] = summary
         
         # 2. 함수들을 타입별로 분류
@@ -923,7 +929,7 @@ class CodeAnalysisService:
             file_analysis = await self._process_multi_chunk_analysis(filename, chunks)
         
         # 6. 분석 결과를 Redis에 캐싱 (파일 단위)
-        file_cache_key = f"{user_id}:file_analysis:{filename}"
+        file_cache_key = redis_keys.file_analysis(user_id, commit_sha, filename)
         file_analysis_bytes = file_analysis.encode('utf-8') if isinstance(file_analysis, str) else file_analysis
         self.redis_client.setex(file_cache_key, 86400 * 3, file_analysis_bytes)  # 3일 보관
         
@@ -1127,7 +1133,7 @@ LLM 호출 오류: {e}
         suggestions = await self._call_llm_for_file_analysis(suggestions_prompt)
         
         # Redis에 개선 제안 별도 저장 (str을 bytes로 인코딩)
-        suggestions_key = f"{user_id}:suggestions:{filename}"
+        suggestions_key = redis_keys.file_suggestions(user_id, filename)
         suggestions_bytes = suggestions.encode('utf-8') if isinstance(suggestions, str) else suggestions
         self.redis_client.setex(suggestions_key, 86400 * 7, suggestions_bytes)  # 7일 보관
 
@@ -1182,7 +1188,7 @@ LLM 호출 오류: {e}
             # 1. 현재 활성 DB 찾기 (Redis → Supabase 순) - repo별로 구분
             def _sync_redis_db_get():
                 try:
-                    return self.redis_client.get(f"user:{user_id}:{repo}:db_id")
+                    return self.redis_client.get(redis_keys.repo_db_id(user_id, repo))
                 except Exception as e:
                     api_logger.error(f"Redis DB ID 조회 실패: {e}")
                     return None
@@ -1216,7 +1222,7 @@ LLM 호출 오류: {e}
             api_logger.info(f"최종 DB ID: {curr_db_id}")
             
             # 2. 해당 DB의 페이지들 찾기 (Redis → Supabase 순)
-            pages_key = f"user:{user_id}:db:{curr_db_id}:pages"
+            pages_key = redis_keys.db_pages(user_id, curr_db_id)
             
             def _sync_redis_pages_get():
                 try:
@@ -1262,7 +1268,7 @@ LLM 호출 오류: {e}
     async def _append_analysis_to_notion(self, ai_analysis_log_page_id: str, analysis_summary: str, commit_sha: str, user_id: str, repo: str):
         """분석 결과를 제목3 토글 블록으로 노션에 추가 (I/O 오프로드)"""
         # 1. Notion 토큰 조회 (I/O 오프로드)
-        token_key = f"user:{user_id}:notion_token"
+        token_key = redis_keys.provider_token(user_id, "notion")
         api_logger.info(f"Redis에서 토큰 조회 시도: {token_key}")
         
         def _sync_token_get():
@@ -1358,6 +1364,17 @@ LLM 호출 오류: {e}
                 commit_sha
             )
             api_logger.info(f"Notion에 분석 결과 추가 완료: {commit_sha[:8]}")
+
+            # API 프로세스가 캐시한 페이지 본문 제거 (워커의 NotionService는 async Redis가 없어 직접 삭제)
+            page_content_key = redis_keys.notion_page_content(token, ai_analysis_log_page_id)
+
+            def _sync_page_content_invalidate():
+                try:
+                    self.redis_client.delete(page_content_key)
+                except Exception as e:
+                    api_logger.error(f"페이지 본문 캐시 삭제 실패: {e}")
+
+            await asyncio.get_event_loop().run_in_executor(await self._get_shared_executor(), _sync_page_content_invalidate)
         except Exception as e:
             api_logger.error(f"Notion 서비스 호출 실패: {e}")
             api_logger.error(traceback.format_exc())
\ No newline at end of file
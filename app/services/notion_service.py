@@ -2,11 +2,13 @@
 Notion API 연동 서비스
 """
 import asyncio
+import weakref
 from typing import Optional, List, Dict, Any
-from datetime import datetime, date
+from datetime import datetime, date, timezone
 import httpx
+import orjson
 from app.core.config import settings
-from app.core.exceptions import NotionAPIError
+from app.core.exceptions import NotionAPIError, NotionClientError, RateLimitedError
 from app.utils.logger import notion_logger
 from app.utils.notion_utils import markdown_to_notion_blocks, extract_text_from_rich_text, get_toggle_content, convert_block_to_markdown
 from app.models.database import (
@@ -20,55 +22,311 @@ from app.models.learning import (
     LearningPagesRequest
 )
 from app.utils.retry import async_retry
+from app.utils.concurrency import run_all
+from app.utils.rate_limiter import TokenBucket
+from app.utils.ttl_cache import TTLCache
 import hashlib
+import redis.asyncio as redis
+from app.core.exceptions import RedisError
+from app.services.redis_service import RedisService
+from app.services import redis_keys
+from operator import itemgetter
+
+# DatabaseInfo.last_used_date 용 현재 시각 (supa.update_last_used_date와 같은 timezone-aware UTC)
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
+# 데이터베이스 메타(title, parent_page_id) 캐시 - 서비스 객체는 요청마다 생성되므로 모듈 단위로 유지
+# key: (토큰, db_id) / value: {"title", "parent_page_id"}
+_DB_META_TTL_SECONDS = 60
+_db_meta_cache = TTLCache(maxsize=4096, ttl=_DB_META_TTL_SECONDS)
+
+# 페이지 하위 데이터베이스 목록 캐시 / key: (토큰, page_id) / value: [{"id", "title"}]
+_PAGE_DATABASES_TTL_SECONDS = 30
+_page_databases_cache = TTLCache(maxsize=1024, ttl=_PAGE_DATABASES_TTL_SECONDS)
+
+# 캐시 키별 조회 락 - 서로 다른 요청(서비스 객체)의 동시 조회도 한 번만 Notion을 호출하도록 모듈 단위로 공유
+# - 약한 참조로 보관하므로 락을 잡거나 기다리는 요청이 없어지면 자동으로 제거되어 크기가 늘어나지 않음
+_cache_locks: "weakref.WeakValueDictionary[tuple, asyncio.Lock]" = weakref.WeakValueDictionary()
+
+def _get_cache_lock(key: tuple) -> asyncio.Lock:
+    return _cache_locks.setdefault(key, asyncio.Lock())
+
+# 데이터베이스 메타 Redis 캐시 - 프로세스/워커 간 공유되는 2차 캐시 (redis_client가 주입된 경우에만 사용)
+# - Notion에서 직접 바뀐 제목 등은 무효화할 방법이 없으므로 로컬 캐시와 같은 TTL만 유지
+_DB_META_REDIS_TTL_SECONDS = _DB_META_TTL_SECONDS
+
+# 페이지 본문(블록 목록) Redis 캐시 - redis_client가 주입된 경우에만 사용 (읽기 전용 조회에 opt-in)
+_PAGE_CONTENT_CACHE_TTL_SECONDS = 30
+_redis_service = RedisService()
+
+# Notion API 공용 HTTP 클라이언트 (HTTP/2 멀티플렉싱 + keep-alive 커넥션 풀)
+# - 서비스 객체는 요청마다 생성되므로 커넥션 풀은 모듈 단위로 공유
+# - 워커는 작업마다 새 이벤트 루프를 만들기 때문에 루프가 바뀌면 새로 생성
+#   (작업이 끝날 때 close_http_client로 닫아 두므로 보통은 닫힌 클라이언트를 교체하게 됨)
+_NOTION_BASE_URL = "https://api.notion.com/v1"
+_http_client: Optional[httpx.AsyncClient] = None
+_http_client_loop: Optional[asyncio.AbstractEventLoop] = None
+_http_version_logged = False
+
+def get_http_client() -> httpx.AsyncClient:
+    """현재 이벤트 루프에 바인딩된 공용 Notion HTTP 클라이언트 반환"""
+    global _http_client, _http_client_loop
+    loop = asyncio.get_running_loop()
+    if _http_client is None or _http_client.is_closed or _http_client_loop is not loop:
+        if _http_client is not None and not _http_client.is_closed:
+            _discard_http_client(_http_client, _http_client_loop)
+        _http_client = httpx.AsyncClient(
+            base_url=_NOTION_BASE_URL,
+            headers={**_COMMON_HEADERS_BASE, "Notion-Version": settings.NOTION_API_VERSION},
+            http2=True,
+            limits=httpx.Limits(
+                max_connections=settings.NOTION_HTTP_MAX_CONNECTIONS,
+                max_keepalive_connections=settings.NOTION_HTTP_MAX_KEEPALIVE
+            ),
+            timeout=httpx.Timeout(connect=5.0, read=30.0, write=10.0, pool=5.0)
+        )
+        _http_client_loop = loop
+    return _http_client
+
+def _discard_http_client(client: httpx.AsyncClient, loop: Optional[asyncio.AbstractEventLoop]) -> None:
+    """다른 루프에 바인딩된 이전 클라이언트 정리 (커넥션은 생성된 루프에서만 닫을 수 있음)"""
+    if loop is not None and loop.is_running() and not loop.is_closed():
+        asyncio.run_coroutine_threadsafe(client.aclose(), loop)
+        return
+    # 루프가 이미 끝났으면 소켓을 정상 종료할 방법이 없음 -> 루프 종료 전에 close_http_client를 호출해야 함
+    notion_logger.warning("이전 이벤트 루프의 Notion HTTP 클라이언트를 닫지 못한 채 교체합니다")
+
+async def close_http_client() -> None:
+    """공용 Notion HTTP 클라이언트 종료 (애플리케이션 종료 시 호출)"""
+    global _http_client, _http_client_loop
+    if _http_client is not None and not _http_client.is_closed:
+        await _http_client.aclose()
+    _http_client = None
+    _http_client_loop = None
+
+# 통합 토큰별 요청 속도 제한 (Notion은 통합당 평균 초당 3회로 제한)
+# - 서비스 객체는 요청마다 생성되므로 같은 토큰의 요청끼리 버킷을 공유하도록 모듈 단위로 유지
+# - 사용할 때마다 만료 시각을 갱신하므로 일정 시간 쓰이지 않은 토큰의 버킷만 제거 (다시 만들면 가득 찬 버킷과 동일)
+_RATE_LIMITER_IDLE_SECONDS = 600
+_rate_limiters = TTLCache(maxsize=4096, ttl=_RATE_LIMITER_IDLE_SECONDS)
+
+def _get_rate_limiter(token: str) -> TokenBucket:
+    limiter = _rate_limiters.get(token)
+    if limiter is None:
+        limiter = TokenBucket(settings.NOTION_RATE_LIMIT_PER_SECOND, settings.NOTION_RATE_LIMIT_BURST)
+    _rate_limiters.set(token, limiter)
+    return limiter
+
+def _parse_retry_after(response: httpx.Response) -> Optional[float]:
+    """429 응답의 Retry-After 헤더(초 단위)를 float로 변환 (없거나 형식이 다르면 None)"""
+    try:
+        return max(float(response.headers["Retry-After"]), 0.0)
+    except (KeyError, ValueError):
+        return None
+
+def _log_http_version_once(response: httpx.Response) -> None:
+    """협상된 HTTP 버전을 프로세스당 한 번만 기록 (HTTP/2 적용 여부 확인용)"""
+    global _http_version_logged
+    if not _http_version_logged:
+        _http_version_logged = True
+        notion_logger.debug(f"Notion API HTTP 버전: {response.http_version}")
+
+# 학습 페이지 일괄 생성 시 동시에 진행할 최대 페이지 수 (실제 HTTP 동시성은 _sem/토큰 버킷이 추가로 제한)
+_BULK_CREATE_CONCURRENCY = 5
+
+# 페이지 마크다운 변환 시 동시에 처리할 최대 블록 수 (하위 블록 조회 fan-out 제한)
+_MARKDOWN_CONVERT_CONCURRENCY = 10
+
+# 공통 요청 헤더 (공용 클라이언트 기본 헤더, 인스턴스별로는 Authorization만 추가)
+_COMMON_HEADERS_BASE = {"Content-Type": "application/json"}
+
+# 학습 페이지 템플릿 고정 블록 (요청 바디로 직렬화만 되고 변경되지 않으므로 재사용)
+def _text_block(block_type: str, content: str) -> Dict[str, Any]:
+    return {
+        "object": "block", "type": block_type,
+        block_type: {"rich_text": [{"type": "text", "text": {"content": content}}]}
+    }
+
+def _todo_block(goal: str) -> Dict[str, Any]:
+    return {
+        "object": "block", "type": "to_do",
+        "to_do": {"rich_text": [{"type": "text", "text": {"content": goal}}], "checked": False}
+    }
+
+# 학습 DB 행(row) 속성 추출
+_get_row_props = itemgetter("학습 제목", "날짜", "진행 상태", "복습 여부")
+
+def _row_to_page(row: Dict[str, Any]) -> Dict[str, Any]:
+    """학습 DB 행을 list_all_pages 응답 형태로 변환"""
+    title, day, status, revisit = _get_row_props(row["properties"])
+    title_texts = title["title"]
+    day_value = day["date"]
+    status_value = status["select"]
+    return {
+        "page_id": row["id"],
+        "title": title_texts[0]["text"]["content"] if title_texts else "(제목 없음)",
+        "date": day_value["start"] if day_value else None,
+        "status": status_value["name"] if status_value else "(상태 없음)",
+        "revisit": bool(revisit["checkbox"])
+    }
+
+def _page_title(page: Dict[str, Any]) -> str:
+    """search 결과 페이지의 제목 추출 (없으면 Untitled)"""
+    try:
+        return page["properties"]["title"]["title"][0]["plain_text"]
+    except (KeyError, IndexError, TypeError):
+        return "Untitled"
+
+_DIVIDER = {"object": "block", "type": "divider", "divider": {}}
+_GOAL_HEADING = _text_block("heading_2", "🧠 학습 목표")
+_CONTENT_HEADING = _text_block("heading_2", "📝 학습 내용")
+_CONTENT_QUOTE = _text_block("quote", "학습한 내용을 정리하는 공간입니다.")
+_EMPTY_PARAGRAPH = _text_block("paragraph", "")
+_AI_HEADING = _text_block("heading_2", "🤖 AI 분석 결과")
+_AI_QUOTE = _text_block("quote", "MCP 요청과 커밋 분석 결과가 저장되는 공간입니다.")
+_LOG_INTRO_QUOTE = _text_block("quote", "이 페이지는 커밋된 코드를 분석한 결과가 토글로 저장되는 공간입니다.")
+
+# 학습 데이터베이스 속성 스키마 (create_database 요청마다 동일)
+_DB_PROPERTIES_TEMPLATE = {
+    "학습 제목": {"title": {}},
+    "날짜": {"date": {}},
+    "진행 상태": {"select": {"options": [
+        {"name": "시작 전", "color": "gray"},
+        {"name": "진행중", "color": "blue"},
+        {"name": "완료", "color": "green"}
+    ]}},
+    "복습 여부": {"checkbox": {}}
+}
 
 class NotionService:
-    def __init__(self, token: str, timeout_seconds: int = 180):
+    def __init__(self, token: str, timeout_seconds: int = 180, redis_client: Optional[redis.Redis] = None):
         self.api_key = token
+        self._redis = redis_client
         self.api_version = settings.NOTION_API_VERSION
-        self.base_url = "https://api.notion.com/v1"
-        self.headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Notion-Version": self.api_version,
-            "Content-Type": "application/json"
-        }
+        self.base_url = _NOTION_BASE_URL
+        # 요청마다 dict → Headers 정규화를 반복하지 않도록 인스턴스 생성 시 한 번만 변환
+        self.headers = httpx.Headers({"Authorization": f"Bearer {self.api_key}"})
         self.timeout = httpx.Timeout(timeout_seconds, connect=20.0)
+        # 병렬(gather) 호출이 늘어나도 rate limit(429)에 걸리지 않도록 동시 요청 수 제한
+        self._sem = asyncio.Semaphore(settings.NOTION_MAX_CONCURRENCY)
+        self._limiter = _get_rate_limiter(token)
+
+    # 데이터베이스 메타 캐시 조회/저장
+    def _get_cached_db_meta(self, database_id: str) -> Optional[Dict[str, str]]:
+        """TTL 이내에 캐시된 데이터베이스 메타 반환 (없거나 만료되면 None)"""
+        return _db_meta_cache.get((self.api_key, database_id))
+
+    def _set_cached_db_meta(self, database_id: str, title: str, parent_page_id: str) -> Dict[str, str]:
+        meta = {"title": title, "parent_page_id": parent_page_id}
+        _db_meta_cache.set((self.api_key, database_id), meta)
+        return meta
+
+    def _invalidate_cache(self, resource_id: str) -> None:
+        """수정/삭제된 리소스의 캐시 제거"""
+        _db_meta_cache.pop((self.api_key, resource_id), None)
+        _page_databases_cache.pop((self.api_key, resource_id), None)
+
+    def _page_content_cache_key(self, page_id: str) -> str:
+        return redis_keys.notion_page_content(self.api_key, page_id)
+
+    def _db_meta_redis_key(self, database_id: str) -> str:
+        return redis_keys.notion_db_meta(self.api_key, database_id)
+
+    async def _store_db_meta(self, database_id: str, title: str, parent_page_id: str) -> Dict[str, str]:
+        """메타를 로컬 캐시와 Redis 캐시에 함께 저장 (Redis 오류는 요청 실패로 이어지지 않음)"""
+        meta = self._set_cached_db_meta(database_id, title, parent_page_id)
+        if self._redis is not None:
+            try:
+                await _redis_service.set_json(
+                    self._db_meta_redis_key(database_id), meta, self._redis,
+                    expire_seconds=_DB_META_REDIS_TTL_SECONDS
+                )
+            except RedisError as e:
+                notion_logger.warning(f"데이터베이스 메타 캐시 저장 실패: {str(e)}")
+        return meta
+
+    async def _invalidate_page_content(self, page_id: str) -> None:
+        """이 서비스로 블록을 수정한 페이지의 본문 캐시 제거 (캐시 오류는 요청 실패로 이어지지 않음)"""
+        if self._redis is None:
+            return
+        try:
+            await _redis_service.delete_key(self._page_content_cache_key(page_id), self._redis)
+        except RedisError as e:
+            notion_logger.warning(f"페이지 본문 캐시 삭제 실패: {str(e)}")
+
+    async def _fetch_db_meta(self, database_id: str) -> Dict[str, str]:
+        """데이터베이스 메타 조회 (로컬 캐시 → Redis 캐시 → Notion GET 순서, 키별 락으로 중복 조회 방지)"""
+        meta = self._get_cached_db_meta(database_id)
+        if meta is not None:
+            return meta
+        async with _get_cache_lock(("db_meta", self.api_key, database_id)):
+            meta = self._get_cached_db_meta(database_id)
+            if meta is not None:
+                return meta
+            if self._redis is not None:
+                try:
+                    cached = await _redis_service.get_json(self._db_meta_redis_key(database_id), self._redis)
+                    if cached is not None:
+                        return self._set_cached_db_meta(database_id, cached["title"], cached["parent_page_id"])
+                except RedisError as e:
+                    notion_logger.warning(f"데이터베이스 메타 캐시 조회 실패: {str(e)}")
+            response = await self._make_request("GET", f"databases/{database_id}")
+            return await self._store_db_meta(
+                database_id,
+                response["title"][0]["text"]["content"],
+                response["parent"]["page_id"]
+            )
 
     # 노션 API 요청 공통 메서드
-    @async_retry(max_retries=2, delay=2.0, backoff=2.0)
+    @async_retry(max_retries=2, delay=2.0, backoff=2.0, non_retryable=(NotionClientError,))
     async def _make_request(self, method: str, endpoint: str, **kwargs) -> Dict[str, Any]:
         """Notion API 요청을 보내는 공통 메서드"""
         url = f"{self.base_url}/{endpoint}"
+        body = kwargs.get("json") or kwargs.get("params")
+        # 요청 바디는 orjson으로 직렬화해 bytes로 전달 (Content-Type은 공용 클라이언트 기본 헤더)
+        if "json" in kwargs:
+            kwargs["content"] = orjson.dumps(kwargs.pop("json"))
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.request(method, url, headers=self.headers, **kwargs)
-                response.raise_for_status()
-                return response.json()
-        except httpx.HTTPError as e:
+            async with self._sem:
+                await self._limiter.acquire()
+                response = await get_http_client().request(
+                    method, endpoint, headers=self.headers, timeout=self.timeout, **kwargs
+                )
+            response.raise_for_status()
+            _log_http_version_once(response)
+            return orjson.loads(response.content)
+        except httpx.HTTPStatusError as e:
             # 요청 바디와 Notion 응답을 함께 로깅합니다.
-            body = kwargs.get("json") or kwargs.get("params")
-            status = e.response.status_code if hasattr(e, 'response') and e.response is not None else None
-            text = e.response.text if hasattr(e, 'response') and e.response is not None else str(e)
-            
-            # ReadTimeout의 경우 특별한 로깅
+            status = e.response.status_code
+            text = e.response.text
+            notion_logger.error(
+                "⛔ Notion API 오류:\n   ▶ Method: %s\n   ▶ URL   : %s\n   ▶ Body  : %s\n   ▶ Status: %s\n   ▶ Error : %s",
+                method, url, body, status, text
+            )
+            # 409(conflict), 429(rate limit), 5xx는 일시적 오류로 재시도, 그 외 4xx는 즉시 실패
+            if status == 429:
+                retry_after = _parse_retry_after(e.response)
+                # 같은 토큰으로 동시에 진행 중인 다른 요청도 Retry-After 동안 보류
+                if retry_after is not None:
+                    self._limiter.pause(retry_after)
+                raise RateLimitedError(f"API 요청 실패: {text}", retry_after)
+            if status < 500 and status != 409:
+                raise NotionClientError(f"API 요청 실패: {text}", status)
+            raise NotionAPIError(f"API 요청 실패: {text}")
+        except httpx.RequestError as e:
+            # 타임아웃/연결 오류 등 네트워크 수준 오류 (응답 없음) - 재시도 대상
             if isinstance(e, httpx.ReadTimeout):
                 notion_logger.warning(
-                    f"⏰ Notion API ReadTimeout (재시도 진행):\n"
-                    f"   ▶ Method: {method}\n"
-                    f"   ▶ URL   : {url}\n"
-                    f"   ▶ Body  : {body}\n"
-                    f"   ▶ Error : 블록 처리로 인한 타임아웃 - 재시도 중"
+                    "⏰ Notion API ReadTimeout (재시도 진행):\n   ▶ Method: %s\n   ▶ URL   : %s\n   ▶ Body  : %s\n   ▶ Error : 블록 처리로 인한 타임아웃 - 재시도 중",
+                    method, url, body
                 )
             else:
                 notion_logger.error(
-                    f"⛔ Notion API 오류:\n"
-                    f"   ▶ Method: {method}\n"
-                    f"   ▶ URL   : {url}\n"
-                    f"   ▶ Body  : {body}\n"
-                    f"   ▶ Status: {status}\n"
-                    f"   ▶ Error : {text}"
+                    "⛔ Notion API 네트워크 오류:\n   ▶ Method: %s\n   ▶ URL   : %s\n   ▶ Error : %r",
+                    method, url, e
                 )
-            raise NotionAPIError(f"API 요청 실패: {text}")
+            raise NotionAPIError(f"API 요청 실패: {e!r}")
         
     
     # 블록 청크별 추가 헬퍼 메서드
@@ -77,26 +335,39 @@ class NotionService:
         parent_block_id: str, 
         children_blocks: List[Dict[str, Any]], 
         chunk_size: int, 
-        delay: float
+        delay: float,
+        after: Optional[str] = None
     ) -> None:
-        """블록을 청크별로 나누어 지연 시간을 두고 추가하는 헬퍼 메서드"""
-        for i in range(0, len(children_blocks), chunk_size):
-            chunk = children_blocks[i:i + chunk_size]
-            
-            await self._make_request(
-                "PATCH",
-                f"blocks/{parent_block_id}/children",
-                json={"children": chunk}
-            )
-            
-            chunk_number = i // chunk_size + 1
-            notion_logger.info(f"블록 청크 {chunk_number} 처리 완료 ({len(chunk)}개 블록)")
-            
-            # 마지막 청크가 아니면 지연
-            if i + chunk_size < len(children_blocks):
-                await asyncio.sleep(delay)
-        
-    
+        """
+        블록을 청크별로 나누어 지연 시간을 두고 추가하는 헬퍼 메서드
+        - after: 지정하면 해당 블록 바로 뒤에 삽입 (없으면 맨 끝에 추가)
+        """
+        try:
+            total = len(children_blocks)
+            for chunk_number, start in enumerate(range(0, total, chunk_size), 1):
+                chunk = children_blocks[start:start + chunk_size]
+                body: Dict[str, Any] = {"children": chunk}
+                if after:
+                    body["after"] = after
+
+                resp = await self._make_request(
+                    "PATCH",
+                    f"blocks/{parent_block_id}/children",
+                    json=body
+                )
+                # 다음 청크는 방금 추가한 마지막 블록 뒤에 이어서 삽입
+                if after and resp.get("results"):
+                    after = resp["results"][-1]["id"]
+
+                notion_logger.info(f"블록 청크 {chunk_number} 처리 완료 ({len(chunk)}개 블록)")
+
+                # 마지막 청크가 아니면 지연
+                if start + chunk_size < total:
+                    await asyncio.sleep(delay)
+        finally:
+            # 일부 청크만 추가된 경우에도 캐시가 남지 않도록 쓰기 이후 항상 무효화
+            await self._invalidate_page_content(parent_block_id)
+
     async def get_workspace_top_pages(self) -> List[Dict]:
         """사용자 워크스페이스의 최상위 페이지 반환"""
         payload = {
@@ -110,22 +381,25 @@ class NotionService:
             }
         }
         
-        response = await self._make_request("POST", "search", json=payload)
-        results = response.get("results", [])
-        
-        # 최상위 페이지만 필터링 (parent.type이 workspace인 경우)
-        top_pages = [
-            {
-                "id": page["id"],
-                "title": page["properties"]["title"]["title"][0]["plain_text"] 
-                        if page.get("properties", {}).get("title", {}).get("title") 
-                        else "Untitled",
-                "url": page["url"],
-                "last_edited": page["last_edited_time"]
-            }
-            for page in results
-            if page.get("parent", {}).get("type") == "workspace"
-        ]
+        # 최상위 페이지만 필터링 (parent.type이 workspace인 경우), 100개 초과 결과도 누락 없이 페이지네이션
+        top_pages: List[Dict] = []
+        cursor = None
+        while True:
+            body = {**payload, "page_size": 100, **({"start_cursor": cursor} if cursor else {})}
+            response = await self._make_request("POST", "search", json=body)
+            top_pages.extend(
+                {
+                    "id": page["id"],
+                    "title": _page_title(page),
+                    "url": page["url"],
+                    "last_edited": page["last_edited_time"]
+                }
+                for page in response.get("results", [])
+                if page.get("parent", {}).get("type") == "workspace"
+            )
+            if not response.get("has_more"):
+                break
+            cursor = response.get("next_cursor")
         
         return top_pages
 
@@ -136,36 +410,29 @@ class NotionService:
         data = {
             "parent": {"page_id": parent_page_id},
             "title": [{"text": {"content": title}}],
-            "properties": {
-                "학습 제목": {"title": {}},
-                "날짜": {"date": {}},
-                "진행 상태": {"select": {"options": [
-                    {"name": "시작 전", "color": "gray"},
-                    {"name": "진행중", "color": "blue"},
-                    {"name": "완료", "color": "green"}
-                ]}},
-                "복습 여부": {"checkbox": {}}
-            }
+            "properties": _DB_PROPERTIES_TEMPLATE
         }
         response = await self._make_request("POST", "databases", json=data)
+        # 부모 페이지의 데이터베이스 목록 캐시 무효화
+        self._invalidate_cache(parent_page_id)
         return DatabaseInfo(
             db_id=response["id"],
             title=title,
             parent_page_id=parent_page_id,
             status=DatabaseStatus.READY,
-            last_used_date=datetime.now()
+            last_used_date=_utcnow()
         )
     # 데이터베이스 정보 조회
     async def get_database(self, database_id: str, workspace_id: str) -> DatabaseInfo:
         """데이터베이스 정보 조회"""
-        response = await self._make_request("GET", f"databases/{database_id}")
+        meta = await self._fetch_db_meta(database_id)
         
         return DatabaseInfo(
-            db_id=response["id"],
-            title=response["title"][0]["text"]["content"],
-            parent_page_id=response["parent"]["page_id"],
+            db_id=database_id,
+            title=meta["title"],
+            parent_page_id=meta["parent_page_id"],
             status=DatabaseStatus.READY,
-            last_used_date=datetime.now(),
+            last_used_date=_utcnow(),
             webhook_id=None,
             webhook_status="inactive",
             workspace_id=workspace_id
@@ -174,18 +441,27 @@ class NotionService:
     # 페이지에 연결된 데이터베이스 목록 조회
     async def list_databases_in_page(self, page_id: str) -> List[DatabaseMetadata]:
         """페이지에 연결된 데이터베이스 목록 조회"""
+        key = (self.api_key, page_id)
         try:
-            resp = await self._make_request(
-                "GET",
-                f"blocks/{page_id}/children",
-                params={"page_size": 100}
-            )
+            databases = _page_databases_cache.get(key)
+            if databases is not None:
+                return databases
 
-            return [
-                {"id": block["id"], "title": block["child_database"]["title"]}
-                for block in resp.get("results", [])
-                if block.get("type") == "child_database"
-            ]
+            async with _get_cache_lock(("page_databases", *key)):
+                databases = _page_databases_cache.get(key)
+                if databases is None:
+                    resp = await self._make_request(
+                        "GET",
+                        f"blocks/{page_id}/children",
+                        params={"page_size": 100}
+                    )
+                    databases = [
+                        {"id": block["id"], "title": block["child_database"]["title"]}
+                        for block in resp.get("results", [])
+                        if block.get("type") == "child_database"
+                    ]
+                    _page_databases_cache.set(key, databases)
+            return databases
             
         except Exception as e:
             notion_logger.error(f"데이터베이스 목록 조회 실패: {str(e)}")
@@ -197,15 +473,15 @@ class NotionService:
         if not db_info:
             return None
             
-        # Notion API에서 데이터베이스 정보 조회
-        response = await self._make_request("GET", f"databases/{db_info['db_id']}")
+        # 캐시된 메타가 없을 때만 Notion API에서 데이터베이스 정보 조회
+        meta = await self._fetch_db_meta(db_info["db_id"])
         
         return DatabaseInfo(
             db_id=db_info["db_id"],
-            title=response["title"][0]["text"]["content"],
-            parent_page_id=response["parent"]["page_id"],
+            title=meta["title"],
+            parent_page_id=meta["parent_page_id"],
             status=db_info["status"],
-            last_used_date=db_info.get("last_used_date", datetime.now()),
+            last_used_date=db_info.get("last_used_date", _utcnow()),
             webhook_id=db_info.get("webhook_id"),
             webhook_status=db_info.get("webhook_status", "inactive"),
             workspace_id=db_info.get("workspace_id")
@@ -215,23 +491,30 @@ class NotionService:
     async def update_database(self, database_id: str, db_update: DatabaseUpdate) -> DatabaseInfo:
         """데이터베이스 정보 업데이트 (Notion API만)"""
         try:
-            # Notion API에서 데이터베이스 정보 조회
-            response = await self._make_request("GET", f"databases/{database_id}")
-            
-            # 제목 업데이트
             if db_update.title:
-                await self._make_request(
+                # 제목 업데이트 - PATCH 응답이 갱신된 데이터베이스 객체이므로 별도 GET 없이 사용
+                response = await self._make_request(
                     "PATCH", 
                     f"databases/{database_id}",
                     json={"title": [{"text": {"content": db_update.title}}]}
                 )
+                # 부모 페이지의 DB 목록 캐시에 이전 제목이 남지 않도록 무효화 후 메타 갱신
+                self._invalidate_cache(response["parent"]["page_id"])
+                meta = await self._store_db_meta(
+                    database_id,
+                    response["title"][0]["text"]["content"],
+                    response["parent"]["page_id"]
+                )
+            else:
+                # 변경할 제목이 없으면 캐시된 메타(또는 GET)로 응답 구성
+                meta = await self._fetch_db_meta(database_id)
             
             return DatabaseInfo(
-                db_id=response["id"],
-                title=db_update.title or response["title"][0]["text"]["content"],
-                parent_page_id=response["parent"]["page_id"],
+                db_id=database_id,
+                title=meta["title"],
+                parent_page_id=meta["parent_page_id"],
                 status=db_update.status or DatabaseStatus.READY,
-                last_used_date=datetime.now(),
+                last_used_date=_utcnow(),
                 webhook_id=None,
                 webhook_status=db_update.webhook_status or "inactive"
             )
@@ -270,78 +553,34 @@ class NotionService:
         page_id = page_resp["id"]
         notion_logger.info(f"페이지 생성 성공 - 페이지 ID: {page_id}")
 
-        # 2) 본문 블록 구성
+        # 2) 본문 블록 구성 (고정 블록은 모듈 상수 재사용, 동적인 부분만 생성)
         blocks: List[dict] = [
-            # 🧠 학습 목표
-            {
-                "object":"block","type":"heading_2",
-                "heading_2":{"rich_text":[{"type":"text","text":{"content":"🧠 학습 목표"}}]}
-            },
-            {
-                "object":"block","type":"quote",
-                "quote":{"rich_text":[{"type":"text","text":{"content":plan.goal_intro}}]}
-            },
+            # 🧠 학습 목표 + to-do
+            _GOAL_HEADING,
+            _text_block("quote", plan.goal_intro),
+            *[_todo_block(goal) for goal in plan.goals],
+            # 구분선 / 📝 학습 내용 / 구분선 / 🤖 AI 분석 결과
+            _DIVIDER,
+            _CONTENT_HEADING,
+            _CONTENT_QUOTE,
+            _EMPTY_PARAGRAPH,
+            _DIVIDER,
+            _AI_HEADING,
+            _AI_QUOTE
         ]
-        
-        # 학습 목표 to-do 추가
-        for goal in plan.goals:
-            blocks.append({
-                "object": "block",
-                "type": "to_do",
-                "to_do": {
-                    "rich_text": [{"type": "text", "text": {"content": goal}}],
-                    "checked": False
-                }
-            })
-        
-        # 구분선
-        blocks.append({"object":"block","type":"divider","divider":{}})
-
-        # 📝 학습 내용
-        blocks.extend([
-            {
-                "object":"block","type":"heading_2",
-                "heading_2":{"rich_text":[{"type":"text","text":{"content":"📝 학습 내용"}}]}
-            },
-            {
-                "object":"block","type":"quote",
-                "quote":{"rich_text":[{"type":"text","text":{"content":"학습한 내용을 정리하는 공간입니다."}}]}
-            },
-            {
-                "object": "block",
-                "type": "paragraph",
-                "paragraph": {
-                    "rich_text": [{"type": "text", "text": {"content": ""}}]
-                }
-            }
-        ])
-        
-        # 구분선
-        blocks.append({"object":"block","type":"divider","divider":{}})
-
-        # 🤖 AI 분석 결과
-        blocks.extend([
-            {
-                "object":"block","type":"heading_2",
-                "heading_2":{"rich_text":[{"type":"text","text":{"content":"🤖 AI 분석 결과"}}]}
-            },
-            {
-                "object":"block","type":"quote",
-                "quote":{"rich_text":[{"type":"text","text":{"content":"MCP 요청과 커밋 분석 결과가 저장되는 공간입니다."}}]}
-            }
-        ])
 
         # 3) 모든 블록들을 50개씩 나누어서 페이지에 추가
         await self._patch_children_in_chunks(page_id, blocks, 50, 1.0)
 
-        # 4) 📄 종합 분석 로그 페이지를 별도로 생성
+        # 4) 📄 종합 분석 로그 페이지를 별도로 생성 (기본 안내 블록도 생성 요청에 함께 포함)
         ai_analysis_page_props = {
             "parent": {"page_id": page_id},
             "properties": {
                 "title": {
                     "title": [{"text": {"content": "Commit 분석 로그"}}]
                 }
-            }
+            },
+            "children": [_LOG_INTRO_QUOTE, _DIVIDER]
         }
         ai_page_resp = await self._make_request(
             "POST",
@@ -354,31 +593,32 @@ class NotionService:
         summary_blocks = markdown_to_notion_blocks(plan.summary)
         await self._patch_children_in_chunks(page_id, summary_blocks, 50, 1.0)
 
-        # 6) 종합 분석 로그 페이지에는 기본 안내 내용만 추가
-        log_blocks = [
-            {
-                "object": "block",
-                "type": "quote",
-                "quote": {
-                    "rich_text": [
-                        {
-                            "type": "text",
-                            "text": {"content": "이 페이지는 커밋된 코드를 분석한 결과가 토글로 저장되는 공간입니다."}
-                        }
-                    ]
-                }
-            },
-            {
-                "object": "block",
-                "type": "divider",
-                "divider": {}
-            }
-        ]
-        
-        await self._patch_children_in_chunks(ai_analysis_log_page_id, log_blocks, 50, 1.0)
-
         return page_id, ai_analysis_log_page_id
     
+    # 학습 페이지 일괄 생성
+    async def create_learning_pages(
+        self,
+        database_id: str,
+        plans: List[LearningPageCreate],
+        idempotency_keys: Optional[List[str]] = None
+    ) -> List[tuple[str, str] | Exception]:
+        """
+        여러 학습 페이지를 동시에 생성 (최대 _BULK_CREATE_CONCURRENCY개)
+        - 입력 순서대로 (page_id, ai_analysis_log_page_id) 또는 실패한 페이지의 예외를 반환
+        - 개별 페이지 실패가 나머지 페이지 생성을 중단시키지 않음
+        """
+        semaphore = asyncio.Semaphore(_BULK_CREATE_CONCURRENCY)
+        keys = idempotency_keys or [None] * len(plans)
+
+        async def _create(plan: LearningPageCreate, key: Optional[str]) -> tuple[str, str]:
+            async with semaphore:
+                return await self.create_learning_page(database_id, plan, key)
+
+        return await asyncio.gather(
+            *(_create(plan, key) for plan, key in zip(plans, keys)),
+            return_exceptions=True
+        )
+
     # 데이터베이스 내 모든 페이지 조회
     async def list_all_pages(self, database_id: str) -> List[Dict[str, Any]]:
         """
@@ -395,30 +635,31 @@ class NotionService:
           ...
         ]
         """
-        has_more = True
-        next_cursor = None
-        pages: List[Dict[str, Any]] = []
+        def query(cursor: Optional[str] = None):
+            # Notion 최대 page_size(100)로 요청해 왕복 횟수 최소화
+            body = {"page_size": 100}
+            if cursor:
+                body["start_cursor"] = cursor
+            return self._make_request("POST", f"databases/{database_id}/query", json=body)
 
-        while has_more:
-            body = {"start_cursor": next_cursor} if next_cursor else {}
-            resp = await self._make_request(
-                "POST",
-                f"databases/{database_id}/query",
-                json=body
-            )
-            for row in resp["results"]:
-                props = row["properties"]
-                pages.append({
-                    "page_id": row["id"],
-                    "title": props["학습 제목"]["title"][0]["text"]["content"] if props["학습 제목"]["title"] else "(제목 없음)",
-                    "date":  props["날짜"]["date"]["start"] if props["날짜"]["date"] else None,
-                    "status": props["진행 상태"]["select"]["name"] if props["진행 상태"]["select"] else "(상태 없음)",
-                    "revisit": props["복습 여부"]["checkbox"] if props["복습 여부"]["checkbox"] else False
-                })
-            has_more = resp.get("has_more", False)
-            next_cursor = resp.get("next_cursor")
-            print(pages)
-        return pages
+        pages: List[Dict[str, Any]] = []
+        resp = await query()
+        while True:
+            # 커서는 직전 응답에서만 알 수 있으므로, 다음 페이지 요청을 먼저 보내고 현재 행을 변환
+            next_task = asyncio.create_task(query(resp.get("next_cursor"))) if resp.get("has_more") else None
+            try:
+                pages.extend([_row_to_page(row) for row in resp["results"]])
+            except BaseException:
+                if next_task:
+                    # 취소된 작업도 끝까지 기다려야 "Task was destroyed but it is pending" / 미회수 예외 경고가 남지 않음
+                    next_task.cancel()
+                    await asyncio.gather(next_task, return_exceptions=True)
+                raise
+            if next_task is None:
+                notion_logger.debug("데이터베이스 %s 행 조회 완료: %d개", database_id, len(pages))
+                return pages
+            notion_logger.debug("데이터베이스 %s 행 조회 중: %d개", database_id, len(pages))
+            resp = await next_task
     
     # 페이지 속성 업데이트
     async def update_page_properties(self, page_id: str, props: Dict[str, Any]) -> None:
@@ -433,67 +674,86 @@ class NotionService:
             json={"properties": props}
         )
 
+    # 학습 목표 섹션 블록 조회
+    async def _find_goal_section(self, page_id: str) -> tuple[Optional[Dict[str, Any]], List[Dict[str, Any]]]:
+        """
+        '🧠 학습 목표' 헤더 아래의 quote 블록과 to_do 블록 목록 반환
+        - 페이지 끝까지 페이지네이션하되, 다음 heading_2를 만나면 조회 중단
+        """
+        in_section = False
+        quote_block = None
+        todo_blocks: List[Dict[str, Any]] = []
+        params: Dict[str, Any] = {"page_size": 100}
+
+        while True:
+            resp = await self._make_request("GET", f"blocks/{page_id}/children", params=params)
+            blocks = resp.get("results", [])
+            notion_logger.debug("목표 섹션 갱신용 블록 조회: %d개", len(blocks))
+
+            for block in blocks:
+                block_type = block.get("type")
+                if block_type == "heading_2":
+                    if in_section:
+                        return quote_block, todo_blocks
+                    rich_text = block["heading_2"]["rich_text"]
+                    in_section = bool(rich_text) and "🧠 학습 목표" in rich_text[0]["text"]["content"]
+                elif in_section:
+                    if block_type == "quote":
+                        quote_block = block
+                    elif block_type == "to_do":
+                        todo_blocks.append(block)
+
+            if not resp.get("has_more"):
+                return quote_block, todo_blocks
+            params["start_cursor"] = resp.get("next_cursor")
+
     # 학습 목표 섹션 업데이트
     async def update_goal_section(self,page_id: str, goal_intro: Optional[str] = None, goals: Optional[List[str]] = None) -> None:
         """
         학습 목표 섹션(quote, to_do) 업데이트
         """
-        # 1. 모든 블록 조회
-        resp = await self._make_request(
-            "GET",
-            f"blocks/{page_id}/children",
-            params={"page_size": 100}
-        )
-        blocks = resp.get("results", [])
+        # 1~2. 목표 섹션(quote, to_do) 블록 조회
+        quote_block, todo_blocks = await self._find_goal_section(page_id)
 
-        # 2. 목표 섹션 헤더 위치 찾기
-        start_idx = None
-        quote_block = None
-        todo_blocks = []
-        print(f'blocks: {blocks}')
-        for idx, block in enumerate(blocks):
-            if block.get("type") == "heading_2" and "🧠 학습 목표" in block["heading_2"]["rich_text"][0]["text"]["content"]:
-                start_idx = idx
-                continue
-            if start_idx is not None:
-                if block.get("type") == "quote":
-                    quote_block = block
-                elif block.get("type") == "to_do":
-                    todo_blocks.append(block)
-                elif block.get("type") == "heading_2":
-                    break
+        # 서로 다른 블록을 건드리는 요청들이므로 한 번에 동시 실행
+        ops = []
 
         # 3. quote 업데이트
         if goal_intro is not None and quote_block:
-            await self._make_request(
+            ops.append(self._make_request(
                 "PATCH",
                 f"blocks/{quote_block['id']}",
                 json={
                     "quote": {"rich_text": [{"type": "text", "text": {"content": goal_intro}}]}
                 }
-            )
+            ))
 
-        # 4. to_do 업데이트
+        # 4. to_do 업데이트 - 기존 블록은 내용만 수정하고, 개수 차이만큼만 추가/삭제
         if goals is not None:
-            # 기존 to_do 삭제
-            print(f'todo_blocks: {todo_blocks}')
-            for block in todo_blocks:
-                print(f'block: {block}')
-                await self._make_request("DELETE", f"blocks/{block['id']}")
-            
-            new_todos = []
-            for goal in goals:
-                new_todos.append({
-                    "object": "block",
-                    "type": "to_do",
-                    "to_do": {
-                        "rich_text": [{"type": "text", "text": {"content": goal}}],
-                        "checked": False
-                    }
-                })
-            
-            if new_todos:
-                await self._patch_children_in_chunks(page_id, new_todos, 50, 1.0)
+            common = min(len(todo_blocks), len(goals))
+            ops.extend(
+                self._make_request("PATCH", f"blocks/{block['id']}", json={"to_do": _todo_block(goal)["to_do"]})
+                for block, goal in zip(todo_blocks, goals)
+            )
+            # 남는 기존 to_do 삭제
+            ops.extend(
+                self._make_request("DELETE", f"blocks/{block['id']}") for block in todo_blocks[common:]
+            )
+            # 부족한 to_do는 섹션 마지막 블록(to_do 또는 quote) 뒤에 추가
+            if len(goals) > common:
+                anchor = todo_blocks[common - 1] if common else quote_block
+                ops.append(self._patch_children_in_chunks(
+                    page_id,
+                    [_todo_block(goal) for goal in goals[common:]],
+                    50, 1.0,
+                    after=anchor["id"] if anchor else None
+                ))
+
+        # 동시 요청 수는 _make_request 세마포어로 제한, 하나라도 실패하면 나머지 취소
+        try:
+            await run_all(*ops)
+        finally:
+            await self._invalidate_page_content(page_id)
 
     # 요약 페이지 업데이트
     async def update_ai_summary_by_page(self, page_id: str, summary: str) -> None:
@@ -510,18 +770,29 @@ class NotionService:
         1. 속성 업데이트
         2. 목표 섹션 업데이트
         3. 요약 페이지 업데이트
-        """
-        # 1. 속성 업데이트
-        if props:
-            await self.update_page_properties(page_id, props)
 
-        # 2. 목표 섹션
-        if goal_intro is not None or goals is not None:
-            await self.update_goal_section(page_id, goal_intro, goals)
+        하나라도 실패하면 첫 번째 예외를 그대로 전파하고 아직 진행 중인 나머지 업데이트는 취소
+        - 롤백은 없으므로 이미 반영된 속성/블록은 페이지에 그대로 남음
+        - 취소 시점에 따라 목표 섹션이나 요약이 일부 블록만 추가된 상태일 수 있음 (같은 요청을 다시 보내면 목표 섹션은 누락분만 채움)
+        """
+        # 속성 PATCH만 본문 수정과 동시에 진행
+        # - 목표 섹션에 기준 블록(quote/to_do)이 없으면 to_do가 페이지 끝에 붙으므로
+        #   요약 추가와 겹치면 블록 순서가 요청마다 달라짐 -> 본문 수정은 목표 섹션 → 요약 순서로 차례대로 진행
+        async def update_body() -> None:
+            # 2. 목표 섹션
+            if goal_intro is not None or goals is not None:
+                await self.update_goal_section(page_id, goal_intro, goals)
+            # 3. 요약 페이지
+            if summary is not None:
+                await self.update_ai_summary_by_page(page_id, summary)
 
-        # 3. 요약 페이지
-        if summary is not None:
-            await self.update_ai_summary_by_page(page_id, summary)
+        coros = []
+        # 1. 속성
+        if props:
+            coros.append(self.update_page_properties(page_id, props))
+        if goal_intro is not None or goals is not None or summary is not None:
+            coros.append(update_body())
+        await run_all(*coros)
 
     # 코드 분석 결과 추가
     async def append_code_analysis_to_page(self, page_id: str, analysis_summary: str, commit_sha: str) -> None:
@@ -531,7 +802,8 @@ class NotionService:
         content_blocks = markdown_to_notion_blocks(analysis_summary)
         
         # 2. 먼저 빈 제목3 토글 블록 생성
-        today = date.today().strftime("%Y-%m-%d")
+        short_sha = commit_sha[:8]
+        today = date.today().isoformat()
         heading_toggle_block = {
             "object": "block",
             "type": "heading_3",
@@ -539,7 +811,7 @@ class NotionService:
                 "rich_text": [
                     {
                         "type": "text", 
-                        "text": {"content": f"📅 {today} 코드 분석 ({commit_sha[:8]})"}
+                        "text": {"content": f"📅 {today} 코드 분석 ({short_sha})"}
                     }
                 ],
                 "is_toggleable": True
@@ -548,11 +820,14 @@ class NotionService:
         }
         
         # 3. 빈 토글 블록을 노션 페이지에 먼저 추가
-        toggle_response = await self._make_request(
-            "PATCH",
-            f"blocks/{page_id}/children",
-            json={"children": [heading_toggle_block]}
-        )
+        try:
+            toggle_response = await self._make_request(
+                "PATCH",
+                f"blocks/{page_id}/children",
+                json={"children": [heading_toggle_block]}
+            )
+        finally:
+            await self._invalidate_page_content(page_id)
         
         # 4. 생성된 토글 블록의 ID 추출
         toggle_block_id = toggle_response["results"][0]["id"]
@@ -560,10 +835,24 @@ class NotionService:
         # 5. content_blocks를 50개씩 나누어서 토글 블록에 추가
         await self._patch_children_in_chunks(toggle_block_id, content_blocks, 50, 1.0)
 
-        notion_logger.info(f"코드 분석 결과 추가 완료: {commit_sha[:8]} (총 {len(content_blocks)}개 블록)")
+        notion_logger.info(f"코드 분석 결과 추가 완료: {short_sha} (총 {len(content_blocks)}개 블록)")
 
     # 페이지 메타 및 블록 조회
-    async def get_page_content(self, page_id: str) -> Dict[str, Any]:
+    async def get_page_content(self, page_id: str, use_cache: bool = False) -> Dict[str, Any]:
+        """
+        페이지의 모든 하위 블록 조회
+        - use_cache: redis_client가 주입된 경우 결과를 짧은 TTL로 캐시 (읽기 전용 조회에서만 사용)
+        """
+        use_cache = use_cache and self._redis is not None
+        if use_cache:
+            cache_key = self._page_content_cache_key(page_id)
+            try:
+                cached = await _redis_service.get_json(cache_key, self._redis)
+                if cached is not None:
+                    return cached
+            except RedisError as e:
+                notion_logger.warning(f"페이지 본문 캐시 조회 실패: {str(e)}")
+
         blocks, cursor = [], None
         while True:
             resp = await self._make_request(
@@ -575,13 +864,20 @@ class NotionService:
             if not resp.get("has_more"):
                 break
             cursor = resp["next_cursor"]
-        return {"blocks": blocks}
+
+        content = {"blocks": blocks}
+        if use_cache:
+            try:
+                await _redis_service.set_json(cache_key, content, self._redis, expire_seconds=_PAGE_CONTENT_CACHE_TTL_SECONDS)
+            except RedisError as e:
+                notion_logger.warning(f"페이지 본문 캐시 저장 실패: {str(e)}")
+        return content
     
     async def get_page_content_as_markdown(self, page_id: str) -> str:
         """페이지의 모든 블록을 마크다운 문자열로 변환하여 반환 (커밋 분석 토글 제외)"""
         try:
             # 1. 페이지의 모든 블록 조회
-            page_content = await self.get_page_content(page_id)
+            page_content = await self.get_page_content(page_id, use_cache=True)
             blocks = page_content.get("blocks", [])
             
             if not blocks:
@@ -604,15 +900,18 @@ class NotionService:
                 
                 filtered_blocks.append(block)
             
-            # 3. 필터링된 블록들을 마크다운 문자열로 변환
-            content_parts = []
-            for block in filtered_blocks:
-                block_text = await convert_block_to_markdown(block, self._make_request)
-                if block_text:
-                    content_parts.append(block_text)
-            
+            # 3. 필터링된 블록들을 마크다운 문자열로 변환 (하위 블록 조회가 있으므로 동시 변환, 최대 10개)
+            semaphore = asyncio.Semaphore(_MARKDOWN_CONVERT_CONCURRENCY)
+
+            async def _convert(block: Dict[str, Any]) -> str:
+                async with semaphore:
+                    return await convert_block_to_markdown(block, self._make_request)
+
+            # 입력 순서대로 결과를 반환하므로 블록 순서 유지, 하나라도 실패하면 나머지 변환(하위 블록 조회)은 취소
+            content_parts = await run_all(*(_convert(block) for block in filtered_blocks))
+
             # 4. 전체 내용을 하나의 문자열로 결합
-            return "\n\n".join(content_parts)
+            return "\n\n".join(part for part in content_parts if part)
             
         except Exception as e:
             notion_logger.error(f"페이지 마크다운 변환 실패: {str(e)}")
@@ -623,7 +922,11 @@ class NotionService:
         """
         페이지 삭제
         """
-        await self._make_request("PATCH", f"pages/{page_id}", json={"archived": True})
+        try:
+            await self._make_request("PATCH", f"pages/{page_id}", json={"archived": True})
+        finally:
+            self._invalidate_cache(page_id)
+            await self._invalidate_page_content(page_id)
 
     async def get_page_summary(self, page_id: str) -> List[str]:
         """
@@ -660,28 +963,40 @@ class NotionService:
         특정 커밋의 상세 분석 내용 조회 - 해당 커밋 토글 블록의 모든 하위 내용 반환
         """
         try:
-            # 1. 페이지의 모든 블록 조회
-            page_content = await self.get_page_content(page_id)
-            blocks = page_content.get("blocks", [])
-            
-            if not blocks:
-                return "페이지에 분석 내용이 없습니다."
-            
-            # 2. 특정 커밋 SHA에 해당하는 토글 블록 찾기
+            # 1~2. 페이지 블록을 100개 단위로 조회하면서 커밋 SHA에 해당하는 토글 블록 탐색
+            #      (찾는 즉시 페이지네이션 중단 - 나머지 블록은 조회하지 않음)
+            sha = commit_sha.lower()
             target_block = None
-            for block in blocks:
-                if (block.get("type") == "heading_3" and 
-                    block.get("heading_3", {}).get("is_toggleable")):
-                    
-                    title = extract_text_from_rich_text(
-                        block.get("heading_3", {}).get("rich_text", [])
-                    )
-                    
-                    # 커밋 SHA가 제목에 포함되어 있는지 확인
-                    if commit_sha.lower() in title.lower():
-                        target_block = block
-                        break
-            
+            has_blocks = False
+            cursor = None
+            while True:
+                resp = await self._make_request(
+                    "GET", f"blocks/{page_id}/children",
+                    params={"page_size": 100, **({"start_cursor": cursor} if cursor else {})}
+                )
+                blocks = resp.get("results", [])
+                has_blocks = has_blocks or bool(blocks)
+
+                for block in blocks:
+                    if (block.get("type") == "heading_3" and
+                        block.get("heading_3", {}).get("is_toggleable")):
+
+                        title = extract_text_from_rich_text(
+                            block.get("heading_3", {}).get("rich_text", [])
+                        )
+
+                        # 커밋 SHA가 제목에 포함되어 있는지 확인
+                        if sha in title.lower():
+                            target_block = block
+                            break
+
+                if target_block is not None or not resp.get("has_more"):
+                    break
+                cursor = resp["next_cursor"]
+
+            if not has_blocks:
+                return "페이지에 분석 내용이 없습니다."
+
             if not target_block:
                 return f"커밋 {commit_sha}에 대한 분석 결과를 찾을 수 없습니다."
             
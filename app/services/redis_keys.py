@@ -0,0 +1,73 @@
+"""
+Redis 키 스키마
+
+- API와 워커가 같은 키를 쓰도록 Redis 키는 이 모듈의 함수로 생성
+- 인증/토큰/state, 코드 분석 작업 키처럼 새로 도입되거나 짧게 만료되는 키는 짧은 접두어 사용
+- 사용자 설정 키(워크스페이스, 기본 페이지, DB 목록 등)는 기존 키 이름 유지
+  (워크스페이스/페이지/DB 목록은 24시간 만료, Redis가 원본인 기본 페이지/기본 DB는 만료 없음)
+- 길이가 제한되지 않는 값(API 키, 커밋 SHA + 파일 경로 등)은 고정 길이 해시로 축약
+"""
+import hashlib
+
+def _digest(*parts: str) -> str:
+    """가변 길이 구성 요소를 16자리 hex로 축약"""
+    return hashlib.blake2b(":".join(parts).encode(), digest_size=8).hexdigest()
+
+# ── 인증 / 토큰 (TTL 캐시) ──
+def user_id_by_api_key(api_key: str) -> str:
+    # API 키 원문이 키 이름에 남지 않도록 해시
+    return f"u:ak:{_digest(api_key)}"
+
+def provider_token(user_id: str, provider: str) -> str:
+    return f"u:{user_id}:tk:{provider}"
+
+def auth_state(user_id: str) -> str:
+    return f"as:{user_id}"
+
+# ── 사용자 설정 (기존 키 유지) ──
+def user_workspace(user_id: str) -> str:
+    return f"user:{user_id}:workspace"
+
+def workspace_pages(user_id: str, workspace_id: str) -> str:
+    return f"user:{user_id}:workspace:{workspace_id}:pages"
+
+def default_page(user_id: str, workspace_id: str) -> str:
+    return f"user:{user_id}:workspace:{workspace_id}:default_page"
+
+def db_list(user_id: str, workspace_id: str) -> str:
+    return f"user:{user_id}:workspace:{workspace_id}:db_list"
+
+def db_pages(user_id: str, notion_db_id: str) -> str:
+    return f"user:{user_id}:db:{notion_db_id}:pages"
+
+def default_db(user_id: str) -> str:
+    return f"user:{user_id}:default_db"
+
+# ── 코드 분석 (워커) ──
+def func_summaries(user_id: str, commit_sha: str, filename: str) -> str:
+    # 파일 단위 Hash (필드: 함수명, 값: 함수 요약)
+    return f"fh:{user_id}:{_digest(commit_sha, filename)}"
+
+def pending_count(user_id: str, commit_sha: str, filename: str) -> str:
+    # 파일별 분석 대기 중인 함수 수
+    return f"fp:{user_id}:{_digest(commit_sha, filename)}"
+
+def file_suggestions(user_id: str, filename: str) -> str:
+    return f"fs:{user_id}:{_digest(filename)}"
+
+def repo_db_id(user_id: str, repo: str) -> str:
+    # 웹훅 등록 시 저장, 워커가 레포별 학습 DB를 찾을 때 조회
+    return f"u:{user_id}:rdb:{repo}"
+
+def func_analysis(user_id: str, commit_sha: str, filename: str, func_name: str) -> str:
+    return f"fa:{user_id}:{_digest(commit_sha, filename, func_name)}"
+
+def file_analysis(user_id: str, commit_sha: str, filename: str) -> str:
+    return f"fl:{user_id}:{_digest(commit_sha, filename)}"
+
+# ── Notion 응답 캐시 (토큰별, API와 워커가 함께 무효화) ──
+def notion_page_content(token: str, page_id: str) -> str:
+    return f"notion:cache:page_content:{_digest(token, page_id)}"
+
+def notion_db_meta(token: str, database_id: str) -> str:
+    return f"notion:cache:db_meta:{_digest(token, database_id)}"
@@ -1,9 +1,20 @@
-import redis
-from app.utils.retry import async_retry
+import redis.asyncio as redis
 from app.utils.logger import api_logger
 from app.core.exceptions import RedisError
-import json
-import uuid
+from app.services import redis_keys
+import orjson
+import secrets
+import hmac
+from typing import Any, Dict, List, Optional
+
+# 캐시 키 기본 만료 시간 - 다른 저장소(Supabase/Notion)에서 다시 채울 수 있는 값만 만료시킴
+# (기본 최상위 페이지/기본 DB처럼 Redis가 원본인 값은 만료 없음)
+WORKSPACE_CACHE_TTL_SECONDS = 86400  # 워크스페이스/페이지/DB 목록 캐시 (24시간)
+ANALYSIS_CACHE_TTL_SECONDS = 86400 * 7  # 커밋 SHA 기준 분석 결과 (내용이 바뀌지 않으므로 7일)
+
+def _dumps(data) -> bytes:
+    """orjson 직렬화 (json.dumps와 동일하게 int 등 문자열이 아닌 키 허용)"""
+    return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
 
 class RedisService:
     def __init__(self):
@@ -14,7 +25,7 @@ class RedisService:
         Bearer 토큰을 통해 사용자 ID를 저장(1시간 만료)
         """
         try:
-            result = redis_client.set(f"user:{bearer_token}:id", user_id, ex=3600)
+            result = await redis_client.set(redis_keys.user_id_by_api_key(bearer_token), user_id, ex=3600)
             return bool(result)
         except Exception as e:
             self.logger.error(f"사용자 ID 저장 실패: {str(e)}")
@@ -25,7 +36,7 @@ class RedisService:
         Bearer 토큰을 통해 사용자 ID를 조회
         """
         try:
-            user_id = redis_client.get(f"user:{bearer_token}:id")
+            user_id = await redis_client.get(redis_keys.user_id_by_api_key(bearer_token))
             return user_id if user_id else None
         except (redis.ConnectionError, redis.TimeoutError) as e:
             self.logger.warning(f"Redis 연결 실패: {str(e)}")
@@ -34,29 +45,23 @@ class RedisService:
             self.logger.error(f"사용자 ID 조회 실패: {str(e)}")
             raise RedisError(f"사용자 ID 조회 실패: {str(e)}")
     
-    @async_retry(max_retries=3)
     async def set_token(self, user_id: str, token: str, provider: str, redis_client: redis.Redis, expire_seconds: int = 3600) -> bool:
         """
         토큰을 Redis에 저장 (기본 1시간 만료)
         """
         try:
-            self.logger.info(f"사용자 토큰 저장 시작: {user_id}")
-            result = redis_client.set(f"user:{user_id}:provider:{provider}", token, ex=expire_seconds)
-            self.logger.info(f"사용자 토큰 저장 완료: {user_id}")
+            result = await redis_client.set(redis_keys.provider_token(user_id, provider), token, ex=expire_seconds)
             return bool(result)
         except Exception as e:
             self.logger.error(f"사용자 토큰 저장 실패: {str(e)}")
             raise RedisError(f"토큰 저장 실패: {str(e)}")
 
-    @async_retry(max_retries=3)
     async def get_token(self, user_id: str, provider: str, redis_client: redis.Redis) -> str:
         """
         토큰을 Redis에서 가져옴
         """
         try:
-            self.logger.info(f"사용자 토큰 조회 시작: {user_id}")
-            result = redis_client.get(f"user:{user_id}:provider:{provider}")
-            self.logger.info(f"사용자 토큰 조회 완료: {user_id}")
+            result = await redis_client.get(redis_keys.provider_token(user_id, provider))
             return result if result else None
         except Exception as e:
             self.logger.error(f"사용자 토큰 조회 실패: {str(e)}")
@@ -67,45 +72,59 @@ class RedisService:
         사용자 워크스페이스 정보를 Redis에서 가져옴
         """
         try: 
-            result = redis_client.get(f"user:{user_id}:workspace")
+            result = await redis_client.get(redis_keys.user_workspace(user_id))
             return result if result else None
         except Exception as e:
             self.logger.error(f"사용자 워크스페이스 조회 실패: {str(e)}")
             raise RedisError(f"워크스페이스 조회 실패: {str(e)}")
     
-    async def set_user_workspace(self, user_id: str, workspace_id: str, redis_client: redis.Redis) -> bool:
+    async def set_user_workspace(self, user_id: str, workspace_id: str, redis_client: redis.Redis, expire_seconds: int = WORKSPACE_CACHE_TTL_SECONDS) -> bool:
         """
         사용자 워크스페이스 정보를 Redis에 저장
         """
         try: 
-            result = redis_client.set(f"user:{user_id}:workspace", workspace_id)
+            result = await redis_client.set(redis_keys.user_workspace(user_id), workspace_id, ex=expire_seconds)
             return bool(result)
         except Exception as e:
             self.logger.error(f"사용자 워크스페이스 저장 실패: {str(e)}")
             raise RedisError(f"워크스페이스 저장 실패: {str(e)}")
     
+    async def get_user_context(self, user_id: str, redis_client: redis.Redis) -> Dict[str, Optional[str]]:
+        """
+        요청마다 필요한 사용자 캐시 값(워크스페이스 ID, 노션 토큰)을 MGET 한 번으로 조회 (없는 값은 None)
+        """
+        try:
+            workspace_id, notion_token = await redis_client.mget(
+                redis_keys.user_workspace(user_id),
+                redis_keys.provider_token(user_id, "notion")
+            )
+            return {"workspace_id": workspace_id or None, "notion_token": notion_token or None}
+        except Exception as e:
+            self.logger.error(f"사용자 컨텍스트 조회 실패: {str(e)}")
+            raise RedisError(f"사용자 컨텍스트 조회 실패: {str(e)}")
+    
     async def get_workspace_pages(self, user_id: str, workspace_id: str, redis_client: redis.Redis) -> list:
         """
         워크스페이스 페이지 정보를 Redis에서 가져옴
         """
         try: 
-            data = redis_client.get(f"user:{user_id}:workspace:{workspace_id}:pages")
+            data = await redis_client.get(redis_keys.workspace_pages(user_id, workspace_id))
             if data:
                 # JSON 문자열을 리스트로 변환
-                return json.loads(data)
+                return orjson.loads(data)
             return None
         except Exception as e:
             self.logger.error(f"워크스페이스 페이지 조회 실패: {str(e)}")
             raise RedisError(f"워크스페이스 페이지 조회 실패: {str(e)}")
     
-    async def set_workspace_pages(self, user_id: str, workspace_id: str, pages: list, redis_client: redis.Redis) -> bool:
+    async def set_workspace_pages(self, user_id: str, workspace_id: str, pages: list, redis_client: redis.Redis, expire_seconds: int = WORKSPACE_CACHE_TTL_SECONDS) -> bool:
         """
         워크스페이스 페이지 정보를 Redis에 저장
         """
         try:
             # 리스트를 JSON 문자열로 변환
-            json_data = json.dumps(pages)
-            result = redis_client.set(f"user:{user_id}:workspace:{workspace_id}:pages", json_data)
+            json_data = _dumps(pages)
+            result = await redis_client.set(redis_keys.workspace_pages(user_id, workspace_id), json_data, ex=expire_seconds)
             return bool(result)
         except Exception as e:
             self.logger.error(f"워크스페이스 페이지 저장 실패: {str(e)}")
@@ -116,7 +135,7 @@ class RedisService:
         워크스페이스의 기본 페이지 설정
         """
         try: 
-            result = redis_client.set(f"user:{user_id}:workspace:{workspace_id}:default_page", page_id)
+            result = await redis_client.set(redis_keys.default_page(user_id, workspace_id), page_id)
             return bool(result)
         except Exception as e:
             self.logger.error(f"워크스페이스 기본 페이지 설정 실패: {str(e)}")
@@ -127,7 +146,7 @@ class RedisService:
         워크스페이스의 기본 페이지 가져오기
         """
         try: 
-            result = redis_client.get(f"user:{user_id}:workspace:{workspace_id}:default_page")
+            result = await redis_client.get(redis_keys.default_page(user_id, workspace_id))
             return result if result else None
         except Exception as e:
             self.logger.error(f"워크스페이스 기본 페이지 조회 실패: {str(e)}")
@@ -136,13 +155,22 @@ class RedisService:
     async def set_state_uuid(self, user_id: str, redis_client: redis.Redis, expire_seconds: int = 180) -> str:
         """
         OAuth 인증용 state UUID를 생성하고 Redis에 저장 (3분 만료)
+        - 진행 중인 인증(아직 만료되지 않은 state)이 있으면 덮어쓰지 않고 기존 값을 반환
+          (연속 클릭으로 먼저 열린 인증 창의 콜백이 검증에 실패하지 않도록)
         """
         try:
-            state_uuid = str(uuid.uuid4())
-            key = f"auth:state:{user_id}"
-            self.logger.debug(f"Setting state UUID - key: {key}, uuid: {state_uuid}")
-            result = redis_client.set(key, state_uuid, ex=expire_seconds)
-            if not result:
+            # URL-safe 랜덤 문자열 (128비트, 22자) - state 파라미터에 그대로 사용
+            state_uuid = secrets.token_urlsafe(16)
+            key = redis_keys.auth_state(user_id)
+            self.logger.debug("Setting state UUID - key: %s", key)
+            # SET NX: 없을 때만 저장 (확인과 저장을 한 번에 처리)
+            if await redis_client.set(key, state_uuid, ex=expire_seconds, nx=True):
+                return state_uuid
+            existing = await redis_client.get(key)
+            if existing:
+                return existing
+            # 조회 사이에 만료/소비된 경우 한 번 더 저장 시도
+            if not await redis_client.set(key, state_uuid, ex=expire_seconds, nx=True):
                 raise RedisError("State UUID 저장 실패")
             return state_uuid
         except Exception as e:
@@ -154,16 +182,12 @@ class RedisService:
         OAuth 콜백에서 state UUID 검증
         """
         try:
-            key = f"auth:state:{user_id}"
-            stored_uuid = redis_client.get(key)
-            
-            if stored_uuid:
-                # 값이 일치하면 삭제하고 True 반환
-                if stored_uuid == uuid_to_check:
-                    redis_client.delete(key)
-                    return True
-            
-            return False
+            key = redis_keys.auth_state(user_id)
+            # GETDEL로 조회와 삭제를 한 번에 처리 (state는 일회용이므로 재사용 경쟁 상태 차단)
+            stored_uuid = await redis_client.getdel(key)
+            if not stored_uuid or not uuid_to_check:
+                return False
+            return hmac.compare_digest(stored_uuid.encode(), uuid_to_check.encode())
         except Exception as e:
             self.logger.error(f"State UUID 검증 실패: {str(e)}")
             raise RedisError(f"State UUID 검증 실패: {str(e)}")
@@ -173,8 +197,8 @@ class RedisService:
         함수 분석 조회
         """
         try:
-            redis_key = f"{user_id}:func:{commit_sha}:{filename}:{func_name}"
-            cached_result = redis_client.get(redis_key)
+            redis_key = redis_keys.func_analysis(user_id, commit_sha, filename, func_name)
+            cached_result = await redis_client.get(redis_key)
             return cached_result if cached_result else None
         except Exception as e:
             self.logger.error(f"함수 분석 조회 실패: {str(e)}")
@@ -185,32 +209,32 @@ class RedisService:
         파일 분석 조회
         """
         try:
-            redis_key = f"{user_id}:file:{commit_sha}:{filename}"
-            cached_result = redis_client.get(redis_key)
+            redis_key = redis_keys.file_analysis(user_id, commit_sha, filename)
+            cached_result = await redis_client.get(redis_key)
             return cached_result if cached_result else None
         except Exception as e:
             self.logger.error(f"파일 분석 조회 실패: {str(e)}")
             raise RedisError(f"파일 분석 조회 실패: {str(e)}")
         
-    async def set_func_analysis_key(self, analysis_result: str, user_id: str, commit_sha: str, filename: str, func_name: str, redis_client: redis.Redis) -> bool:
+    async def set_func_analysis_key(self, analysis_result: str, user_id: str, commit_sha: str, filename: str, func_name: str, redis_client: redis.Redis, expire_seconds: int = ANALYSIS_CACHE_TTL_SECONDS) -> bool:
         """
         함수 분석 저장
         """
         try:
-            redis_key = f"{user_id}:func:{commit_sha}:{filename}:{func_name}"
-            result = redis_client.set(redis_key, analysis_result)
+            redis_key = redis_keys.func_analysis(user_id, commit_sha, filename, func_name)
+            result = await redis_client.set(redis_key, analysis_result, ex=expire_seconds)
             return bool(result)
         except Exception as e:
             self.logger.error(f"함수 분석 저장 실패: {str(e)}")
             raise RedisError(f"함수 분석 저장 실패: {str(e)}")
     
-    async def set_file_analysis_key(self, analysis_result: str, user_id: str, commit_sha: str, filename: str, redis_client: redis.Redis) -> bool:
+    async def set_file_analysis_key(self, analysis_result: str, user_id: str, commit_sha: str, filename: str, redis_client: redis.Redis, expire_seconds: int = ANALYSIS_CACHE_TTL_SECONDS) -> bool:
         """
         파일 분석 저장
         """
         try:
-            redis_key = f"{user_id}:file:{commit_sha}:{filename}"
-            result = redis_client.set(redis_key, analysis_result)
+            redis_key = redis_keys.file_analysis(user_id, commit_sha, filename)
+            result = await redis_client.set(redis_key, analysis_result, ex=expire_seconds)
             return bool(result)
         except Exception as e:
             self.logger.error(f"파일 분석 저장 실패: {str(e)}")
@@ -221,32 +245,32 @@ class RedisService:
         데이터베이스 페이지 정보를 Redis에서 가져옴
         """
         try:
-            redis_key = f"user:{user_id}:db:{notion_db_id}:pages"
-            cached_result = redis_client.get(redis_key)
-            return json.loads(cached_result) if cached_result else None
+            redis_key = redis_keys.db_pages(user_id, notion_db_id)
+            cached_result = await redis_client.get(redis_key)
+            return orjson.loads(cached_result) if cached_result else None
         except Exception as e:
             self.logger.error(f"DB 페이지 조회 실패: {str(e)}")
             raise RedisError(f"DB 페이지 조회 실패: {str(e)}")
     
-    async def set_db_pages(self, user_id: str, notion_db_id: str, pages: list, redis_client: redis.Redis) -> bool:
+    async def set_db_pages(self, user_id: str, notion_db_id: str, pages: list, redis_client: redis.Redis, expire_seconds: int = WORKSPACE_CACHE_TTL_SECONDS) -> bool:
         """
         데이터베이스 페이지 정보를 Redis에 저장
         """
         try:
-            redis_key = f"user:{user_id}:db:{notion_db_id}:pages"
-            result = redis_client.set(redis_key, json.dumps(pages))
+            redis_key = redis_keys.db_pages(user_id, notion_db_id)
+            result = await redis_client.set(redis_key, _dumps(pages), ex=expire_seconds)
             return bool(result)
         except Exception as e:
             self.logger.error(f"DB 페이지 저장 실패: {str(e)}")
             raise RedisError(f"DB 페이지 저장 실패: {str(e)}")
     
-    async def set_db_list(self, user_id: str, workspace_id: str, pages: list, redis_client: redis.Redis) -> bool:
+    async def set_db_list(self, user_id: str, workspace_id: str, pages: list, redis_client: redis.Redis, expire_seconds: int = WORKSPACE_CACHE_TTL_SECONDS) -> bool:
         """
         사용자의 워크스페이스에 있는 모든 노션 DB들 정보를 Redis에 저장
         """
         try:
-            redis_key = f"user:{user_id}:workspace:{workspace_id}:db_list"
-            result = redis_client.set(redis_key, json.dumps(pages))
+            redis_key = redis_keys.db_list(user_id, workspace_id)
+            result = await redis_client.set(redis_key, _dumps(pages), ex=expire_seconds)
             return bool(result)
         except Exception as e:
             self.logger.error(f"DB 목록 저장 실패: {str(e)}")
@@ -257,9 +281,9 @@ class RedisService:
         사용자의 워크스페이스에 있는 모든 노션 DB들 정보를 Redis에서 가져옴
         """
         try:
-            redis_key = f"user:{user_id}:workspace:{workspace_id}:db_list"
-            cached_result = redis_client.get(redis_key)
-            return json.loads(cached_result) if cached_result else None
+            redis_key = redis_keys.db_list(user_id, workspace_id)
+            cached_result = await redis_client.get(redis_key)
+            return orjson.loads(cached_result) if cached_result else None
         except Exception as e:
             self.logger.error(f"DB 목록 조회 실패: {str(e)}")
             raise RedisError(f"DB 목록 조회 실패: {str(e)}")
@@ -269,8 +293,8 @@ class RedisService:
         사용자의 기본 노션 DB id를 Redis에 저장
         """
         try:
-            redis_key = f"user:{user_id}:default_db"
-            result = redis_client.set(redis_key, default_db)
+            redis_key = redis_keys.default_db(user_id)
+            result = await redis_client.set(redis_key, default_db)
             return bool(result)
         except Exception as e:
             self.logger.error(f"기본 DB 저장 실패: {str(e)}")
@@ -281,8 +305,8 @@ class RedisService:
         사용자의 기본 노션 DB id를 Redis에서 가져옴
         """
         try:
-            redis_key = f"user:{user_id}:default_db"
-            cached_result = redis_client.get(redis_key)
+            redis_key = redis_keys.default_db(user_id)
+            cached_result = await redis_client.get(redis_key)
             return cached_result if cached_result else None
         except Exception as e:
             self.logger.error(f"기본 DB 조회 실패: {str(e)}")
@@ -293,9 +317,9 @@ class RedisService:
         JSON 데이터를 Redis에서 가져옴
         """
         try:
-            data = redis_client.get(key)
+            data = await redis_client.get(key)
             if data:
-                return json.loads(data)
+                return orjson.loads(data)
             return None
         except Exception as e:
             self.logger.error(f"JSON 데이터 조회 실패 (key: {key}): {str(e)}")
@@ -306,22 +330,47 @@ class RedisService:
         JSON 데이터를 Redis에 저장
         """
         try:
-            json_data = json.dumps(data)
+            json_data = _dumps(data)
             if expire_seconds:
-                result = redis_client.set(key, json_data, ex=expire_seconds)
+                result = await redis_client.set(key, json_data, ex=expire_seconds)
             else:
-                result = redis_client.set(key, json_data)
+                result = await redis_client.set(key, json_data)
             return bool(result)
         except Exception as e:
             self.logger.error(f"JSON 데이터 저장 실패 (key: {key}): {str(e)}")
             raise RedisError(f"JSON 데이터 저장 실패 (key: {key}): {str(e)}")
 
+    async def mset_json(self, mapping: Dict[str, Any], redis_client: redis.Redis, expire_seconds: int = None) -> bool:
+        """
+        여러 JSON 데이터를 파이프라인으로 한 번에 저장 (N개 키를 1 RTT로 처리)
+        """
+        try:
+            async with redis_client.pipeline(transaction=False) as pipe:
+                for key, data in mapping.items():
+                    pipe.set(key, _dumps(data), ex=expire_seconds)
+                results = await pipe.execute()
+            return all(results)
+        except Exception as e:
+            self.logger.error(f"JSON 데이터 일괄 저장 실패 (keys: {list(mapping)}): {str(e)}")
+            raise RedisError(f"JSON 데이터 일괄 저장 실패: {str(e)}")
+
+    async def mget_json(self, keys: List[str], redis_client: redis.Redis) -> List[Any]:
+        """
+        여러 JSON 데이터를 MGET으로 한 번에 조회 (없는 키는 None)
+        """
+        try:
+            values = await redis_client.mget(keys)
+            return [orjson.loads(value) if value else None for value in values]
+        except Exception as e:
+            self.logger.error(f"JSON 데이터 일괄 조회 실패 (keys: {keys}): {str(e)}")
+            raise RedisError(f"JSON 데이터 일괄 조회 실패: {str(e)}")
+
     async def delete_key(self, key: str, redis_client: redis.Redis) -> bool:
         """
         Redis 키 삭제
         """
         try:
-            result = redis_client.delete(key)
+            result = await redis_client.delete(key)
             return result > 0
         except Exception as e:
             self.logger.error(f"키 삭제 실패 (key: {key}): {str(e)}")
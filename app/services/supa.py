@@ -6,51 +6,50 @@ import httpx
 from typing import Optional
 from app.models.notion_workspace import WorkspaceStatusUpdate, WorkspaceStatus, UserWorkspaceList, UserWorkspace
 from app.core.exceptions import DatabaseError
+from app.services.notion_service import get_http_client as get_notion_http_client
+from app.utils.ttl_cache import TTLCache
+
+# 워크스페이스별 사용 중인 Notion DB ID의 프로세스 로컬 캐시 (페이지 생성 등 요청마다 조회됨)
+# - 같은 프로세스에서 상태를 바꾸면 즉시 무효화, 다른 프로세스의 변경은 최대 TTL만큼 늦게 반영
+_USED_DB_LOCAL_TTL_SECONDS = 30
+_used_db_cache = TTLCache(maxsize=4096, ttl=_USED_DB_LOCAL_TTL_SECONDS)
+
+# DB별 웹훅 정보 캐시 (웹훅 이벤트 처리마다 조회됨, 웹훅 정보/DB 상태를 쓰는 경로에서 무효화)
+_WEBHOOK_INFO_LOCAL_TTL_SECONDS = 30
+_webhook_info_cache = TTLCache(maxsize=4096, ttl=_WEBHOOK_INFO_LOCAL_TTL_SECONDS)
 
 async def insert_learning_database(db_id: str, title: str, parent_page_id: str, workspace_id: str, supabase: AsyncClient) -> bool:
     """새로운 학습 데이터베이스 등록"""
     try:
+        now = datetime.now(timezone.utc).isoformat()
         data = {
             "db_id": db_id,
             "title": title,
             "parent_page_id": parent_page_id,
             "status": "ready",
-            "created_at": datetime.now(timezone.utc).isoformat(),
-            "updated_at": datetime.now(timezone.utc).isoformat(),
+            "created_at": now,
+            "updated_at": now,
             "workspace_id": workspace_id
         }
         res = await supabase.table("learning_databases").insert(data).execute()
         return bool(res.data)
     except Exception as e:
-        api_logger.error(f"데이터베이스 등록 실패: {str(e)}")
+        api_logger.error("데이터베이스 등록 실패: %s", e)
         raise DatabaseError(f"데이터베이스 등록 실패: {str(e)}")
 
 
 async def get_learning_database_by_title(title: str, supabase: AsyncClient, workspace_id: str) -> tuple:
     """제목으로 학습 데이터베이스 정보 조회"""
     try:
-        res = await supabase.table("learning_databases").select("id, db_id").eq("title", title).eq("workspace_id", workspace_id).execute()
+        res = await supabase.table("learning_databases").select("id, db_id").eq("title", title).eq("workspace_id", workspace_id).limit(1).execute()
         data = res.data
         if data:
             return data[0]["db_id"], data[0]["id"]
         return None, None
     except Exception as e:
-        api_logger.error(f"데이터베이스 조회 실패: {str(e)}")
+        api_logger.error("데이터베이스 조회 실패: %s", e)
         raise DatabaseError(f"데이터베이스 조회 실패: {str(e)}")
 
-async def get_active_learning_database(supabase: AsyncClient, workspace_id: str) -> dict:
-    """현재 활성화된 학습 데이터베이스 조회"""
-    try:
-        res = await supabase.table("learning_databases").select("*").eq("status", "used").eq("workspace_id", workspace_id).execute()
-        data = res.data
-        if data:
-            await update_last_used_date(data[0]["id"], supabase, workspace_id)
-            return data[0]
-        return None
-    except Exception as e:
-        api_logger.error(f"활성 데이터베이스 조회 실패: {str(e)}")
-        raise DatabaseError(f"활성 데이터베이스 조회 실패: {str(e)}")
-
 async def update_learning_database_status(db_id: Optional[str], status: str, supabase: AsyncClient, workspace_id: str) -> dict:
     """학습 데이터베이스 상태 업데이트"""
     try:
@@ -59,6 +58,7 @@ async def update_learning_database_status(db_id: Optional[str], status: str, sup
             .select("id") \
             .eq("status", "used") \
             .eq("workspace_id", workspace_id) \
+            .limit(1) \
             .execute()
         
         old_id = resp.data[0]["id"] if resp.data else None
@@ -67,33 +67,39 @@ async def update_learning_database_status(db_id: Optional[str], status: str, sup
         if status == "ready" and old_id is None:
             return None
 
-        # RPC
+        # RPC (실패하더라도 일부 반영됐을 수 있으므로 캐시는 항상 무효화)
         new_db_id_param = db_id if status == "used" else None
-        res = await supabase.rpc("activate_db_transaction", {
-            "workspace_id": workspace_id,
-            "old_rec_id": old_id,
-            "new_db_id":  new_db_id_param
-        }).execute()
+        try:
+            res = await supabase.rpc("activate_db_transaction", {
+                "workspace_id": workspace_id,
+                "old_rec_id": old_id,
+                "new_db_id":  new_db_id_param
+            }).execute()
+        finally:
+            _used_db_cache.pop(workspace_id, None)
+            if db_id:
+                _webhook_info_cache.pop(db_id, None)
         
         data = res.data[0] if isinstance(res.data, list) and res.data else res.data
         
         return data
         
     except Exception as e:
-        api_logger.error(f"DB 상태 업데이트 실패(db_id={db_id}, status={status}): {e}")
+        api_logger.error("DB 상태 업데이트 실패(db_id=%s, status=%s): %s", db_id, status, e)
         raise DatabaseError(f"DB 상태 업데이트 실패(db_id={db_id}, status={status}): {e}")
 
 async def update_last_used_date(id: int, supabase: AsyncClient, workspace_id: str) -> bool:
     """마지막 사용일 업데이트"""
     try:
+        now = datetime.now(timezone.utc).isoformat()
         res = await supabase.table("learning_databases").update({
-            "last_used_date": datetime.now(timezone.utc).isoformat(),
-            "updated_at": datetime.now(timezone.utc).isoformat(),
+            "last_used_date": now,
+            "updated_at": now,
             "workspace_id": workspace_id
         }).eq("id", id).execute()
         return bool(res.data)
     except Exception as e:
-        api_logger.error(f"마지막 사용일 업데이트 실패: {str(e)}")
+        api_logger.error("마지막 사용일 업데이트 실패: %s", e)
         raise DatabaseError(f"마지막 사용일 업데이트 실패: {str(e)}")
 
 async def get_available_learning_databases(supabase: AsyncClient, workspace_id: str) -> list:
@@ -102,7 +108,7 @@ async def get_available_learning_databases(supabase: AsyncClient, workspace_id:
         res = await supabase.table("learning_databases").select("*").eq("status", "ready").eq("workspace_id", workspace_id).execute()
         return res.data if res and hasattr(res, 'data') else []
     except Exception as e:
-        api_logger.error(f"사용 가능한 데이터베이스 조회 실패: {str(e)}")
+        api_logger.error("사용 가능한 데이터베이스 조회 실패: %s", e)
         raise DatabaseError(f"사용 가능한 데이터베이스 조회 실패: {str(e)}")
 
 async def list_all_learning_databases(supabase: AsyncClient, workspace_id: str, status: str = None) -> list:
@@ -114,30 +120,43 @@ async def list_all_learning_databases(supabase: AsyncClient, workspace_id: str,
         res = await query.order("updated_at", desc=True).execute()
         return res.data if res and hasattr(res, 'data') else []
     except Exception as e:
-        api_logger.error(f"데이터베이스 목록 조회 실패: {str(e)}")
+        api_logger.error("데이터베이스 목록 조회 실패: %s", e)
         raise DatabaseError(f"데이터베이스 목록 조회 실패: {str(e)}")
 
 async def get_db_info_by_id(db_id: str, supabase: AsyncClient, workspace_id: str) -> dict:
     """데이터베이스 ID로 정보 조회"""
     try:
-        res = await supabase.table("learning_databases").select("*").eq("db_id", db_id).eq("workspace_id", workspace_id).execute()
+        res = await supabase.table("learning_databases") \
+            .select("db_id, title, parent_page_id, status, last_used_date, webhook_id, webhook_status") \
+            .eq("db_id", db_id) \
+            .eq("workspace_id", workspace_id) \
+            .limit(1) \
+            .execute()
         return res.data[0] if res.data else None
     except Exception as e:
-        api_logger.error(f"데이터베이스 정보 조회 실패: {str(e)}")
+        api_logger.error("데이터베이스 정보 조회 실패: %s", e)
         raise DatabaseError(f"데이터베이스 정보 조회 실패: {str(e)}")
 
 # 현재 사용중인 Notion DB ID 조회
 async def get_used_notion_db_id(supabase: AsyncClient, workspace_id: str) -> str | None:
     """현재 사용중인 Notion DB ID 조회"""
+    cached = _used_db_cache.get(workspace_id)
+    if cached is not None:
+        return cached
     try: 
         res = await supabase.table("learning_databases") \
             .select("db_id") \
             .eq("status", "used") \
             .eq("workspace_id", workspace_id) \
-            .execute()  
-        return res.data[0]["db_id"] if res.data else None
+            .limit(1) \
+            .execute()
+        db_id = res.data[0]["db_id"] if res.data else None
+        # 활성 DB가 없는 경우는 곧 설정될 수 있으므로 캐시하지 않음
+        if db_id:
+            _used_db_cache.set(workspace_id, db_id)
+        return db_id
     except Exception as e:
-        api_logger.error(f"현재 사용중인 Notion DB ID 조회 실패: {str(e)}")
+        api_logger.error("현재 사용중인 Notion DB ID 조회 실패: %s", e)
         raise DatabaseError(f"현재 사용중인 Notion DB ID 조회 실패: {str(e)}")
 
 async def update_webhook_info(db_id: str, webhook_id: str, supabase: AsyncClient, status: str = "active") -> dict:
@@ -152,29 +171,33 @@ async def update_webhook_info(db_id: str, webhook_id: str, supabase: AsyncClient
         if status == "error":
             update_data["webhook_error"] = "웹훅 생성/업데이트 중 오류 발생"
         
-        res = await supabase.table("learning_databases").update(update_data).eq("db_id", db_id).execute()
+        try:
+            res = await supabase.table("learning_databases").update(update_data).eq("db_id", db_id).execute()
+        finally:
+            _webhook_info_cache.pop(db_id, None)
         return res.data[0] if res.data else None
     except Exception as e:
-        api_logger.error(f"웹훅 정보 업데이트 실패: {str(e)}")
+        api_logger.error("웹훅 정보 업데이트 실패: %s", e)
         raise DatabaseError(f"웹훅 정보 업데이트 실패: {str(e)}")
 
 async def get_webhook_info(db_id: str, supabase: AsyncClient) -> dict:
     """웹훅 정보 조회"""
-    try:
-        res = await supabase.table("learning_databases").select("webhook_id, webhook_status").eq("db_id", db_id).execute()
-        return res.data[0] if res.data else None
+    cached = _webhook_info_cache.get(db_id)
+    if cached is not None:
+        return dict(cached)
+    try:
+        res = await supabase.table("learning_databases").select("webhook_id, webhook_status").eq("db_id", db_id).limit(1).execute()
+        info = res.data[0] if res.data else None
+        if info:
+            _webhook_info_cache.set(db_id, info)
+            return dict(info)
+        return None
     except Exception as e:
-        api_logger.error(f"웹훅 정보 조회 실패: {str(e)}")
+        api_logger.error("웹훅 정보 조회 실패: %s", e)
         raise DatabaseError(f"웹훅 정보 조회 실패: {str(e)}")
 
-async def get_webhook_info_by_db_id(db_id: str, supabase: AsyncClient) -> dict:
-    """DB ID로 웹훅 정보를 조회"""
-    try:
-        res = await supabase.table("learning_databases").select("webhook_id, webhook_status").eq("db_id", db_id).execute()
-        return res.data[0] if res.data else None
-    except Exception as e:
-        api_logger.error(f"웹훅 정보 조회 실패: {str(e)}")
-        raise DatabaseError(f"웹훅 정보 조회 실패: {str(e)}")
+# DB ID로 웹훅 정보를 조회 (기존 이름 유지)
+get_webhook_info_by_db_id = get_webhook_info
 
 async def log_webhook_operation(
     db_id: str, 
@@ -187,6 +210,7 @@ async def log_webhook_operation(
 ) -> dict:
     """웹훅 작업 로그 기록"""
     try:
+        now = datetime.now(timezone.utc).isoformat()
         data = {
             "db_id": db_id,
             "operation_type": operation_type,
@@ -195,16 +219,16 @@ async def log_webhook_operation(
             "payload": payload,
             "error_message": error_message,
             "retry_count": 0,
-            "created_at": datetime.now(timezone.utc).isoformat(),
-            "updated_at": datetime.now(timezone.utc).isoformat()
+            "created_at": now,
+            "updated_at": now
         }
         res = await supabase.table("webhook_operations").insert(data).execute()
         if res.data:
-            api_logger.info(f"웹훅 작업 로그 기록 성공: {res.data[0]['id']}")
+            api_logger.info("웹훅 작업 로그 기록 성공: %s", res.data[0]['id'])
             return res.data[0]
         return None
     except Exception as e:
-        api_logger.error(f"웹훅 작업 로그 기록 실패: {str(e)}")
+        api_logger.error("웹훅 작업 로그 기록 실패: %s", e)
         raise DatabaseError(f"웹훅 작업 로그 기록 실패: {str(e)}")
 
 async def insert_learning_page(date: str, title: str, page_id: str, ai_block_id: str, learning_db_id: str, supabase: AsyncClient) -> bool:
@@ -220,16 +244,22 @@ async def insert_learning_page(date: str, title: str, page_id: str, ai_block_id:
         res = await supabase.table("learning_pages").insert(data).execute()
         return bool(res.data)
     except Exception as e:
-        api_logger.error(f"학습 페이지 저장 실패: {str(e)}")
+        api_logger.error("학습 페이지 저장 실패: %s", e)
         raise DatabaseError(f"학습 페이지 저장 실패: {str(e)}")
 
 async def get_learning_page_by_date(date: str, user_id: str, supabase: AsyncClient) -> dict:
     """날짜별 학습 페이지 조회"""
     try:
-        res = await supabase.table("learning_pages").select("*").eq("date", date).eq("user_id", user_id).execute()
+        # 같은 날짜에 페이지가 여러 개일 수 있으므로 single 대신 limit(1)
+        res = await supabase.table("learning_pages") \
+            .select("date, title, page_id, ai_block_id, learning_db_id") \
+            .eq("date", date) \
+            .eq("user_id", user_id) \
+            .limit(1) \
+            .execute()
         return res.data[0] if res.data else None
     except Exception as e:
-        api_logger.error(f"학습 페이지 조회 실패: {str(e)}")
+        api_logger.error("학습 페이지 조회 실패: %s", e)
         raise DatabaseError(f"학습 페이지 조회 실패: {str(e)}")
 
 async def update_ai_block_id(page_id: str, new_ai_block_id: str, user_id: str, supabase: AsyncClient) -> bool:
@@ -238,7 +268,7 @@ async def update_ai_block_id(page_id: str, new_ai_block_id: str, user_id: str, s
         res = await supabase.table("learning_pages").update({"ai_block_id": new_ai_block_id}).eq("page_id", page_id).eq("user_id", user_id).execute()
         return bool(res.data)
     except Exception as e:
-        api_logger.error(f"AI 블록 ID 업데이트 실패: {str(e)}")
+        api_logger.error("AI 블록 ID 업데이트 실패: %s", e)
         raise DatabaseError(f"AI 블록 ID 업데이트 실패: {str(e)}")
 
 async def get_ai_block_id_by_page_id(page_id: str, workspace_id: str, supabase: AsyncClient) -> str:
@@ -249,14 +279,12 @@ async def get_ai_block_id_by_page_id(page_id: str, workspace_id: str, supabase:
             .select("ai_block_id, learning_databases!inner(workspace_id)")\
             .eq("page_id", page_id)\
             .eq("learning_databases.workspace_id", workspace_id)\
+            .limit(1)\
             .execute()
-            
-        data = res.data
-        if data and len(data) > 0 and "ai_block_id" in data[0]:
-            return data[0]["ai_block_id"]
-        return None
+
+        return res.data[0].get("ai_block_id") if res.data else None
     except Exception as e:
-        api_logger.error(f"AI 블록 ID 조회 실패: {str(e)}")
+        api_logger.error("AI 블록 ID 조회 실패: %s", e)
         raise DatabaseError(f"AI 블록 ID 조회 실패: {str(e)}")
 
 async def get_failed_webhook_operations(supabase: AsyncClient, limit: int = 10) -> list:
@@ -271,7 +299,7 @@ async def get_failed_webhook_operations(supabase: AsyncClient, limit: int = 10)
             .execute()
         return res.data if res.data else []
     except Exception as e:
-        api_logger.error(f"실패한 웹훅 작업 조회 실패: {str(e)}")
+        api_logger.error("실패한 웹훅 작업 조회 실패: %s", e)
         raise DatabaseError(f"실패한 웹훅 작업 조회 실패: {str(e)}")
 
 async def update_webhook_operation_status(
@@ -307,11 +335,11 @@ async def update_webhook_operation_status(
             .execute()
         
         if res.data:
-            api_logger.info(f"웹훅 작업 상태 업데이트 성공: {operation_id} -> {status}")
+            api_logger.info("웹훅 작업 상태 업데이트 성공: %s -> %s", operation_id, status)
             return True
         return False
     except Exception as e:
-        api_logger.error(f"웹훅 작업 상태 업데이트 실패: {str(e)}")
+        api_logger.error("웹훅 작업 상태 업데이트 실패: %s", e)
         raise DatabaseError(f"웹훅 작업 상태 업데이트 실패: {str(e)}")
 
 async def get_databases_in_page(page_id: str, supabase: AsyncClient) -> list:
@@ -324,44 +352,41 @@ async def get_databases_in_page(page_id: str, supabase: AsyncClient) -> list:
             "Content-Type": "application/json"
         }
         
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url, headers=headers, timeout=30.0)
-            response.raise_for_status()
-            
-            blocks = response.json().get("results", [])
-            databases = []
-            
-            for block in blocks:
-                if block.get("type") == "child_database":
-                    database = {
-                        "id": block.get("id"),
-                        "title": block.get("child_database", {}).get("title"),
-                        "created_time": block.get("created_time"),
-                        "last_edited_time": block.get("last_edited_time")
-                    }
-                    databases.append(database)
-            
-            api_logger.info(f"Found {len(databases)} databases in page {page_id}")
-            return databases
-            
+        # 요청마다 새 연결(TCP+TLS)을 맺지 않도록 NotionService와 같은 공용 클라이언트 사용
+        response = await get_notion_http_client().get(url, headers=headers, timeout=30.0)
+        response.raise_for_status()
+
+        blocks = response.json().get("results", [])
+        databases = []
+
+        for block in blocks:
+            if block.get("type") == "child_database":
+                database = {
+                    "id": block.get("id"),
+                    "title": block.get("child_database", {}).get("title"),
+                    "created_time": block.get("created_time"),
+                    "last_edited_time": block.get("last_edited_time")
+                }
+                databases.append(database)
+
+        api_logger.info("Found %s databases in page %s", len(databases), page_id)
+        return databases
+
     except httpx.HTTPError as e:
-        api_logger.error(f"HTTP error while fetching databases: {str(e)}")
+        api_logger.error("HTTP error while fetching databases: %s", e)
         raise DatabaseError(f"HTTP error while fetching databases: {str(e)}")
     except Exception as e:
-        api_logger.error(f"Error fetching databases: {str(e)}")
+        api_logger.error("Error fetching databases: %s", e)
         raise DatabaseError(f"Error fetching databases: {str(e)}")
 
 async def activate_database(db_id: str, supabase: AsyncClient, workspace_id: str) -> bool:
     """데이터베이스를 활성화"""
     try:
-        active_db = await get_active_learning_database(supabase, workspace_id)
-        if active_db:
-            await update_learning_database_status(active_db['db_id'], 'ready', supabase, workspace_id)
-        
+        # 기존 활성 DB 해제와 새 DB 활성화는 activate_db_transaction RPC 한 번으로 처리
         await update_learning_database_status(db_id, 'used', supabase, workspace_id)
         return True
     except Exception as e:
-        api_logger.error(f"Error activating database: {str(e)}")
+        api_logger.error("Error activating database: %s", e)
         raise DatabaseError(f"Error activating database: {str(e)}")
 
 async def deactivate_database(db_id: str, supabase: AsyncClient, workspace_id: str, end_status: bool = False) -> bool:
@@ -371,17 +396,22 @@ async def deactivate_database(db_id: str, supabase: AsyncClient, workspace_id: s
         await update_learning_database_status(db_id, new_status, supabase, workspace_id)
         return True
     except Exception as e:
-        api_logger.error(f"Error deactivating database: {str(e)}")
+        api_logger.error("Error deactivating database: %s", e)
         raise DatabaseError(f"Error deactivating database: {str(e)}")
 
 async def update_learning_database(db_id: str, update_data: dict, supabase: AsyncClient, workspace_id: str) -> dict:
     """학습 DB 정보 업데이트"""
     try:
         update_data["updated_at"] = datetime.now(timezone.utc).isoformat()
-        res = await supabase.table("learning_databases").update(update_data).eq("db_id", db_id).eq("workspace_id", workspace_id).execute()
+        try:
+            res = await supabase.table("learning_databases").update(update_data).eq("db_id", db_id).eq("workspace_id", workspace_id).execute()
+        finally:
+            # 상태/웹훅 필드도 바뀔 수 있으므로 관련 로컬 캐시 무효화
+            _used_db_cache.pop(workspace_id, None)
+            _webhook_info_cache.pop(db_id, None)
         return res.data[0] if res.data else None
     except Exception as e:
-        api_logger.error(f"DB 업데이트 실패: {str(e)}")
+        api_logger.error("DB 업데이트 실패: %s", e)
         raise DatabaseError(f"DB 업데이트 실패: {str(e)}")
     
 async def delete_learning_page(page_id: str, supabase: AsyncClient) -> None:
@@ -389,53 +419,63 @@ async def delete_learning_page(page_id: str, supabase: AsyncClient) -> None:
     try : 
         await supabase.table("learning_pages").delete().eq("page_id", page_id).execute()
     except Exception as e:
-        api_logger.error(f"학습 페이지 메타 삭제 실패: {str(e)}")
+        api_logger.error("학습 페이지 메타 삭제 실패: %s", e)
         raise DatabaseError(f"학습 페이지 메타 삭제 실패: {str(e)}")
 
 async def auth_user(user_id:str, auth_token:str, supabase: AsyncClient) -> dict:
     """유저 인증"""
     try:
-        res = await supabase.auth.admin.getUserById(user_id)
-        return res.data
+        res = await supabase.auth.admin.get_user_by_id(user_id)
+        return res.user.model_dump() if res.user else None
     except Exception as e:
-        api_logger.error(f"유저 인증 실패: {str(e)}")
+        api_logger.error("유저 인증 실패: %s", e)
         raise DatabaseError(f"유저 인증 실패: {str(e)}")
 
 async def get_default_workspace(user_id: str, supabase: AsyncClient) -> Optional[str]:
     """기본(active) 워크스페이스 조회"""
     try:
-        res = await supabase.table("user_workspace").select("*").eq("user_id", user_id).eq("status", "active").execute()
+        res = await supabase.table("user_workspace").select("workspace_id").eq("user_id", user_id).eq("status", "active").limit(1).execute()
         if res.data and len(res.data) > 0:
             return res.data[0]["workspace_id"]
         return None
     except Exception as e:
-        api_logger.error(f"기본 워크스페이스 조회 실패: {str(e)}")
+        api_logger.error("기본 워크스페이스 조회 실패: %s", e)
         raise DatabaseError(f"기본 워크스페이스 조회 실패: {str(e)}")
 
 async def switch_active_workspace(user_id: str, update: WorkspaceStatusUpdate, supabase: AsyncClient) -> dict:
     """활성 워크스페이스 변경, 기존 워크스페이스 비활성화 한 후 새로운 워크스페이스 활성화, 이전 workspace의 used(사용중인)db도 비활성화 -> RPC 트랜잭션 사용"""
     try:
-        result = await supabase.rpc("activate_workspace_transaction",{
-            "p_user_id": user_id, 
-            "p_workspace_id": update.workspace_id
-        }).execute()
+        # 이전 워크스페이스의 used DB도 함께 바뀌지만 어느 워크스페이스/DB인지 모르므로 캐시 전체 무효화
+        try:
+            result = await supabase.rpc("activate_workspace_transaction",{
+                "p_user_id": user_id, 
+                "p_workspace_id": update.workspace_id
+            }).execute()
+        finally:
+            _used_db_cache.clear()
+            _webhook_info_cache.clear()
 
         return result.data
     except Exception as e:
-        api_logger.error(f"워크스페이스 활성화 실패: {str(e)}")
+        api_logger.error("워크스페이스 활성화 실패: %s", e)
         raise DatabaseError(f"워크스페이스 활성화 실패: {str(e)}")
     
 async def deactivate_all_workspaces(user_id: str, supabase: AsyncClient) -> dict:
     """유저의 모든 워크스페이스 비활성화, 이전 workspace의 used(사용중인)db도 비활성화 -> RPC 트랜잭션 사용"""
     try:
-        result = await supabase.rpc("activate_workspace_transaction",{
-            "p_user_id": user_id, 
-            "p_workspace_id": None
-        }).execute()
+        # 이전 워크스페이스의 used DB도 함께 바뀌지만 어느 워크스페이스/DB인지 모르므로 캐시 전체 무효화
+        try:
+            result = await supabase.rpc("activate_workspace_transaction",{
+                "p_user_id": user_id, 
+                "p_workspace_id": None
+            }).execute()
+        finally:
+            _used_db_cache.clear()
+            _webhook_info_cache.clear()
 
         return result.data
     except Exception as e:
-        api_logger.error(f"워크스페이스 비활성화 실패: {str(e)}")
+        api_logger.error("워크스페이스 비활성화 실패: %s", e)
         raise DatabaseError(f"워크스페이스 비활성화 실패: {str(e)}")
 
 async def get_workspaces(user_id: str, supabase: AsyncClient) -> UserWorkspaceList:
@@ -444,7 +484,7 @@ async def get_workspaces(user_id: str, supabase: AsyncClient) -> UserWorkspaceLi
         res = await supabase.table("user_workspace").select("*").eq("user_id", user_id).execute()
         return UserWorkspaceList(workspaces=res.data)
     except Exception as e:
-        api_logger.error(f"워크스페이스 조회 실패: {str(e)}")
+        api_logger.error("워크스페이스 조회 실패: %s", e)
         raise DatabaseError(f"워크스페이스 조회 실패: {str(e)}")
 
 async def set_workspaces(workspaces: list[UserWorkspace], supabase: AsyncClient) -> dict:
@@ -461,7 +501,7 @@ async def set_workspaces(workspaces: list[UserWorkspace], supabase: AsyncClient)
         
         return res.data
     except Exception as e:
-        api_logger.error(f"워크스페이스 설정 실패: {str(e)}")
+        api_logger.error("워크스페이스 설정 실패: %s", e)
         raise DatabaseError(f"워크스페이스 설정 실패: {str(e)}")
     
 async def get_github_pat(db_id: str, supabase: AsyncClient):
@@ -471,7 +511,7 @@ async def get_github_pat(db_id: str, supabase: AsyncClient):
             .eq("provider","github").single().execute()
         return res.data["access_token"]
     except Exception as e:
-        api_logger.error(f"Github PAT 조회 실패: {str(e)}")
+        api_logger.error("Github PAT 조회 실패: %s", e)
         raise DatabaseError(f"Github PAT 조회 실패: {str(e)}")
 
 async def get_active_webhooks(owner: str, repo: str, supabase: AsyncClient):
@@ -486,7 +526,7 @@ async def get_active_webhooks(owner: str, repo: str, supabase: AsyncClient):
         
         return res  
     except Exception as e:
-        api_logger.error(f"활성 웹훅 정보 조회 실패: {str(e)}")
+        api_logger.error("활성 웹훅 정보 조회 실패: %s", e)
         raise DatabaseError(f"활성 웹훅 정보 조회 실패: {str(e)}")
 
 # 웹훅 관련 함수들 추가
@@ -496,7 +536,7 @@ async def delete_learning_page_by_system_id(system_id: str, supabase: AsyncClien
         delete_result = await supabase.table("learning_pages").delete().eq("id", system_id).execute()
         return bool(delete_result.data)
     except Exception as e:
-        api_logger.error(f"학습 페이지 삭제 실패 (시스템 ID: {system_id}): {str(e)}")
+        api_logger.error("학습 페이지 삭제 실패 (시스템 ID: %s): %s", system_id, e)
         raise DatabaseError(f"학습 페이지 삭제 실패 (시스템 ID: {system_id}): {str(e)}")
 
 async def clear_ai_block_id(system_id: str, supabase: AsyncClient) -> bool:
@@ -507,16 +547,19 @@ async def clear_ai_block_id(system_id: str, supabase: AsyncClient) -> bool:
         }).eq("id", system_id).execute()
         return bool(update_result.data)
     except Exception as e:
-        api_logger.error(f"AI 블록 ID 초기화 실패 (시스템 ID: {system_id}): {str(e)}")
+        api_logger.error("AI 블록 ID 초기화 실패 (시스템 ID: %s): %s", system_id, e)
         raise DatabaseError(f"AI 블록 ID 초기화 실패 (시스템 ID: {system_id}): {str(e)}")
 
 async def delete_learning_database_by_system_id(system_id: str, supabase: AsyncClient) -> bool:
     """시스템 UUID로 학습 데이터베이스 삭제"""
     try:
         db_delete_result = await supabase.table("learning_databases").delete().eq("id", system_id).execute()
+        # 삭제된 DB의 워크스페이스를 알 수 없으므로 캐시 전체 무효화
+        _used_db_cache.clear()
+        _webhook_info_cache.clear()
         return bool(db_delete_result.data)
     except Exception as e:
-        api_logger.error(f"학습 데이터베이스 삭제 실패 (시스템 ID: {system_id}): {str(e)}")
+        api_logger.error("학습 데이터베이스 삭제 실패 (시스템 ID: %s): %s", system_id, e)
         raise DatabaseError(f"학습 데이터베이스 삭제 실패 (시스템 ID: {system_id}): {str(e)}")
 
 async def get_webhook_operations(
@@ -534,7 +577,7 @@ async def get_webhook_operations(
         res = await query.order("created_at", desc=True).limit(limit).execute()
         return res.data if res.data else []
     except Exception as e:
-        api_logger.error(f"웹훅 작업 목록 조회 실패: {str(e)}")
+        api_logger.error("웹훅 작업 목록 조회 실패: %s", e)
         raise DatabaseError(f"웹훅 작업 목록 조회 실패: {str(e)}")
 
 async def get_webhook_operation_detail(operation_id: str, supabase: AsyncClient) -> dict:
@@ -549,7 +592,7 @@ async def get_webhook_operation_detail(operation_id: str, supabase: AsyncClient)
             return res.data[0]
         return None
     except Exception as e:
-        api_logger.error(f"웹훅 작업 상세 조회 실패: {str(e)}")
+        api_logger.error("웹훅 작업 상세 조회 실패: %s", e)
         raise DatabaseError(f"웹훅 작업 상세 조회 실패: {str(e)}")
 
 async def send_feedback(message: str, user_id: str, supabase: AsyncClient) -> dict:
@@ -561,5 +604,5 @@ async def send_feedback(message: str, user_id: str, supabase: AsyncClient) -> di
         }).execute()
         return res.data
     except Exception as e:
-        api_logger.error(f"피드백 전송 실패: {str(e)}")
+        api_logger.error("피드백 전송 실패: %s", e)
         raise DatabaseError(f"피드백 전송 실패: {str(e)}")
\ No newline at end of file
@@ -2,7 +2,7 @@
 워크스페이스 캐싱 전용 서비스
 """
 from typing import Dict, Any
-import redis
+import redis.asyncio as redis
 from supabase._async.client import AsyncClient
 from app.services.redis_service import RedisService
 from app.utils.logger import api_logger
@@ -0,0 +1,32 @@
+"""
+비동기 동시 실행 유틸리티
+"""
+import asyncio
+from typing import Any, Awaitable, List
+
+_HAS_TASK_GROUP = hasattr(asyncio, "TaskGroup")
+
+async def run_all(*aws: Awaitable[Any]) -> List[Any]:
+    """
+    여러 코루틴을 동시에 실행하고 입력 순서대로 결과 반환
+
+    - 하나라도 실패하면 나머지 진행 중인 작업을 취소하고 첫 번째 예외를 그대로 전파
+    - Python 3.11+ 에서는 asyncio.TaskGroup, 그 이하(3.10)에서는 gather + 수동 취소로 동작
+    """
+    if _HAS_TASK_GROUP:
+        try:
+            async with asyncio.TaskGroup() as tg:
+                tasks = [tg.create_task(aw) for aw in aws]
+        except BaseExceptionGroup as eg:  # noqa: F821 (3.11+ 내장)
+            # 호출부의 기존 except(NotionAPIError 등)가 그대로 동작하도록 첫 예외만 전파
+            raise eg.exceptions[0] from eg
+        return [task.result() for task in tasks]
+
+    tasks = [asyncio.ensure_future(aw) for aw in aws]
+    try:
+        return await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
@@ -115,22 +115,38 @@ def serialize_page_props(props: dict) -> dict:
     return r
 
 # 페이지 컨텐츠 중 필요한 부분만 추려내기
+# 블록 타입별 추출 함수 (rich_text가 비어 있으면 빈 문자열)
+def _first_text(rich_text: list) -> str:
+    return rich_text[0]["text"]["content"] if rich_text else ""
+
+def _extract_text(data: dict, base: dict) -> None:
+    base["text"] = _first_text(data["rich_text"])
+
+def _extract_todo(data: dict, base: dict) -> None:
+    base["text"] = _first_text(data["rich_text"])
+    base["checked"] = data["checked"]
+
+def _extract_code(data: dict, base: dict) -> None:
+    base["text"] = _first_text(data["rich_text"])
+    base["lang"] = data["language"]
+
+_BLOCK_EXTRACTORS = {
+    "heading_1": _extract_text,
+    "heading_2": _extract_text,
+    "heading_3": _extract_text,
+    "quote": _extract_text,
+    "to_do": _extract_todo,
+    "code": _extract_code,
+}
+
 def block_content(block: dict) -> dict:
     btype = block["type"]
     base = {"id": block["id"], "type": btype, "children": block["has_children"]}
-    match btype:
-        case "heading_2" | "heading_3" | "heading_1":
-            base["text"] = block[btype]["rich_text"][0]["text"]["content"]
-        case "quote":
-            base["text"] = block["quote"]["rich_text"][0]["text"]["content"]
-        case "to_do":
-            base["text"] = block["to_do"]["rich_text"][0]["text"]["content"]
-            base["checked"] = block["to_do"]["checked"]
-        case "code":
-            base["text"] = block["code"]["rich_text"][0]["text"]["content"]
-            base["lang"] = block["code"]["language"]
-        case _:
-            base["text"] = ""
+    extractor = _BLOCK_EXTRACTORS.get(btype)
+    if extractor is None:
+        base["text"] = ""
+    else:
+        extractor(block[btype], base)
     return base
 
 def _process_markdown_line(line: str) -> dict | None:
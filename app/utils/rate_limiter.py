@@ -0,0 +1,38 @@
+"""
+비동기 요청 속도 제한 유틸리티
+"""
+import asyncio
+import time
+
+class TokenBucket:
+    """
+    토큰 버킷 속도 제한기
+
+    - rate: 초당 보충되는 토큰 수 (평균 허용 요청 수)
+    - capacity: 한 번에 몰아서 보낼 수 있는 최대 요청 수 (burst)
+    - 락 없이 호출 시점에 토큰을 예약하고 부족한 만큼만 대기하므로 이벤트 루프가 바뀌어도(워커) 그대로 사용 가능
+    """
+
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+
+    def _reserve(self) -> float:
+        """토큰 1개를 예약하고 사용 가능해질 때까지 기다려야 하는 시간(초) 반환"""
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+        self._tokens -= 1
+        return max(-self._tokens / self.rate, self._blocked_until - now, 0.0)
+
+    async def acquire(self) -> None:
+        wait = self._reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def pause(self, seconds: float) -> None:
+        """서버가 알려준 대기 시간(Retry-After) 동안 이후 요청을 모두 보류"""
+        self._blocked_until = max(self._blocked_until, time.monotonic() + seconds)
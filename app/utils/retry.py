@@ -7,7 +7,7 @@ from functools import wraps
 from app.utils.logger import api_logger
 import httpx
 
-def async_retry(max_retries: int = 3, delay: float = 1.0, backoff: float = 2.0, exceptions: tuple[Type[Exception], ...] = (Exception,)) -> Callable:
+def async_retry(max_retries: int = 3, delay: float = 1.0, backoff: float = 2.0, exceptions: tuple[Type[Exception], ...] = (Exception,), non_retryable: tuple[Type[Exception], ...] = ()) -> Callable:
     """
     API 요청 재시도 데코레이터
     
@@ -16,6 +16,9 @@ def async_retry(max_retries: int = 3, delay: float = 1.0, backoff: float = 2.0,
         delay: 초기 지연 시간 (초)
         backoff: 지연 시간 증가 계수
         exceptions: 재시도할 예외 타입
+        non_retryable: 재시도 없이 즉시 전파할 예외 타입 (영구 오류)
+
+    예외에 retry_after(초) 값이 있으면 (예: RateLimitedError) 지수 백오프 대신 그 시간만큼 대기
     """
     def decorator(func: Callable) -> Callable:
         @wraps(func)
@@ -26,6 +29,8 @@ def async_retry(max_retries: int = 3, delay: float = 1.0, backoff: float = 2.0,
             for attempt in range(max_retries):
                 try:
                     return await func(*args, **kwargs)
+                except non_retryable:
+                    raise
                 except exceptions as e:
                     last_exception = e
                     
@@ -40,11 +45,14 @@ def async_retry(max_retries: int = 3, delay: float = 1.0, backoff: float = 2.0,
                         error_msg = f"{e.__class__.__name__}: {str(e)}"
                     
                     if attempt < max_retries - 1:
+                        # 서버가 알려준 대기 시간(Retry-After)이 있으면 우선 사용
+                        retry_after = getattr(e, "retry_after", None)
+                        wait = retry_after if retry_after is not None else current_delay
                         api_logger.warning(
                             f"Attempt {attempt + 1} failed: {error_msg}. "
-                            f"Retrying in {current_delay} seconds..."
+                            f"Retrying in {wait} seconds..."
                         )
-                        await asyncio.sleep(current_delay)
+                        await asyncio.sleep(wait)
                         current_delay *= backoff
                     else:
                         api_logger.error(
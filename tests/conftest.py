@@ -301,12 +301,13 @@ def mock_supabase():
 
 @pytest.fixture
 def mock_redis():
-    """모킹된 Redis 클라이언트"""
+    """모킹된 Redis 클라이언트 (redis.asyncio - 명령은 await 대상)"""
     mock_redis = Mock()
-    mock_redis.get.return_value = None
-    mock_redis.set.return_value = True
-    mock_redis.delete.return_value = True
-    mock_redis.exists.return_value = False
+    mock_redis.get = AsyncMock(return_value=None)
+    mock_redis.set = AsyncMock(return_value=True)
+    mock_redis.setex = AsyncMock(return_value=True)
+    mock_redis.delete = AsyncMock(return_value=True)
+    mock_redis.exists = AsyncMock(return_value=False)
     return mock_redis
 
 
@@ -129,7 +129,6 @@ def test_databases_services_import():
         from app.services.supa import (
             list_all_learning_databases,
             update_learning_database_status,
-            get_active_learning_database,
             insert_learning_database,
             get_db_info_by_id,
             update_learning_database
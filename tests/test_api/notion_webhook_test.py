@@ -1,5 +1,6 @@
+import pytest
 from fastapi.testclient import TestClient
-from unittest.mock import patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 
 def test_notion_webhook_endpoint(client: TestClient):
@@ -8,3 +9,23 @@ def test_notion_webhook_endpoint(client: TestClient):
         response = client.post("/notion_webhook_public/")
         assert response.status_code != 404
 
+
+
+@pytest.mark.asyncio
+async def test_process_webhook_event_logs_operation_once_with_final_status():
+    """작업 로그는 pending 기록 + 상태 갱신 대신 처리 결과와 함께 한 번만 기록"""
+    from app.api.v1.handler.notion_webhook_handler import NotionWebhookHandler
+    handler = NotionWebhookHandler()
+    handler.handle_page_deleted = AsyncMock()
+    payload = {"workspace_id": "ws", "type": "page.deleted", "entity": {"id": "p1"}}
+    learning_data = {"entity_map": {"p1": {"type": "learning_page", "db_id": "db1"}}}
+
+    with patch("app.api.v1.handler.notion_webhook_handler.workspace_cache_service") as cache_service, \
+         patch("app.api.v1.handler.notion_webhook_handler.log_webhook_operation", AsyncMock()) as log_op:
+        cache_service.get_workspace_learning_data = AsyncMock(return_value=learning_data)
+        cache_service.invalidate_workspace_cache = AsyncMock()
+        await handler.process_webhook_event(payload, MagicMock(), MagicMock())
+
+    log_op.assert_awaited_once()
+    assert log_op.await_args.kwargs["status"] == "success"
+    assert log_op.await_args.kwargs["operation_type"] == "delete"
@@ -154,6 +154,43 @@ class TestCodeAnalysisService:
                 assert remaining == 2
                 mock_loop.return_value.run_in_executor.assert_called_once()
     
+    @pytest.mark.asyncio
+    async def test_function_summary_hash_uses_shared_key_builder(self, service):
+        """함수 요약 Hash는 redis_keys 빌더로 만든 키(커밋 SHA + 파일 경로 해시)에 저장"""
+        from app.services import redis_keys
+        pipe = MagicMock()
+        service.redis_client.pipeline = MagicMock(return_value=pipe)
+
+        async def run_inline(executor, fn):
+            return fn()
+
+        with patch.object(service, '_get_shared_executor', AsyncMock(return_value=MagicMock())):
+            with patch('asyncio.get_event_loop') as mock_loop:
+                mock_loop.return_value.run_in_executor = AsyncMock(side_effect=run_inline)
+                await service._save_function_summary_to_hash("u1", "a" * 40, "src/app.py", "handler", "요약")
+
+        file_key = redis_keys.func_summaries("u1", "a" * 40, "src/app.py")
+        assert pipe.hset.call_args.args[:2] == (file_key, "handler")
+        pipe.expire.assert_called_once_with(file_key, 86400 * 7)
+
+    @pytest.mark.asyncio
+    async def test_analyze_code_changes_increments_pending_once_per_file(self, service):
+        """파일당 pending 카운터는 변경된 함수 수만큼 한 번에 증가"""
+        functions = [
+            {"name": "a", "filename": "test.py", "code": "def a(): pass", "has_changes": True},
+            {"name": "b", "filename": "test.py", "code": "def b(): pass", "has_changes": False},
+            {"name": "c", "filename": "test.py", "code": "def c(): pass", "has_changes": True},
+        ]
+        files = [{"filename": "test.py", "status": "modified", "patch": "@@ -1,1 +1,1 @@\n+x"}]
+
+        with patch.object(service, '_extract_functions_from_file', AsyncMock(return_value=functions)), \
+             patch.object(service, '_increment_pending_count', AsyncMock()) as increment, \
+             patch.object(service, 'process_queue', AsyncMock()):
+            await service.analyze_code_changes(files, "owner", "repo", "abc123", "test_user")
+
+        increment.assert_awaited_once_with("test_user", "abc123", "test.py", 2)
+        assert service.function_queue.qsize() == 2
+    
     # ✅ Step 5 테스트: 공유 ThreadPoolExecutor
     @pytest.mark.asyncio
     async def test_shared_executor_lazy_initialization(self):
@@ -372,4 +409,16 @@ class TestCodeAnalysisService:
                             
                             # Then: 병렬 처리로 빠른 완료 (순차 처리보다 빨라야 함)
                             execution_time = end_time - start_time
-                            assert execution_time < 10  # 10초 이내 완료 
\ No newline at end of file
+                            assert execution_time < 10  # 10초 이내 완료 
+
+def test_summary_pack_roundtrip_compresses_large_values():
+    """큰 요약은 압축해 저장하고, 작은 값/기존 평문 값도 그대로 복원"""
+    from app.services.code_analysis_service import _pack_summary, _unpack_summary
+
+    large = "함수 요약 내용입니다. " * 100
+    packed = _pack_summary(large)
+
+    assert len(packed) < len(large.encode("utf-8"))
+    assert _unpack_summary(packed) == large
+    assert _pack_summary("짧은 요약") == "짧은 요약".encode("utf-8")
+    assert _unpack_summary("평문".encode("utf-8")) == "평문"
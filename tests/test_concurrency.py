@@ -0,0 +1,41 @@
+"""
+run_all 동시 실행 유틸리티 테스트
+"""
+import asyncio
+import pytest
+from unittest.mock import patch
+
+from app.core.exceptions import NotionAPIError
+from app.utils.concurrency import run_all
+
+
+@pytest.mark.parametrize("has_task_group", [True, False])
+@pytest.mark.asyncio
+async def test_run_all_propagates_first_error_and_cancels_siblings(has_task_group):
+    """하나가 실패하면 원래 예외 타입 그대로 전파하고 나머지 작업은 취소"""
+    cancelled = asyncio.Event()
+
+    async def slow():
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    async def fail():
+        raise NotionAPIError("실패")
+
+    with patch("app.utils.concurrency._HAS_TASK_GROUP", has_task_group):
+        with pytest.raises(NotionAPIError):
+            await run_all(slow(), fail())
+
+    assert cancelled.is_set()
+
+
+@pytest.mark.asyncio
+async def test_run_all_returns_results_in_order():
+    async def value(v, delay):
+        await asyncio.sleep(delay)
+        return v
+
+    assert await run_all(value("a", 0.02), value("b", 0)) == ["a", "b"]
@@ -0,0 +1,532 @@
+"""
+NotionService 단위 테스트 (Notion API 호출은 _make_request 모킹)
+"""
+import httpx
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from app.core.exceptions import NotionAPIError, NotionClientError
+from app.models.database import DatabaseUpdate
+from app.services.notion_service import NotionService, _db_meta_cache, _page_databases_cache
+
+
+def _toggle(block_id: str, title: str) -> dict:
+    return {
+        "id": block_id,
+        "type": "heading_3",
+        "has_children": True,
+        "heading_3": {
+            "rich_text": [{"type": "text", "text": {"content": title}}],
+            "is_toggleable": True
+        }
+    }
+
+
+class TestNotionService:
+    """NotionService 테스트 클래스"""
+
+    @pytest.fixture
+    def service(self):
+        return NotionService(token="test_token")
+
+    @pytest.mark.asyncio
+    async def test_get_commit_details_stops_paginating_on_match(self, service):
+        """대상 커밋 토글을 찾으면 다음 페이지를 조회하지 않음"""
+        first_page = {
+            "results": [_toggle("t1", "📅 2025-06-01 코드 분석 (abcdef12)")],
+            "has_more": True,
+            "next_cursor": "cursor-2"
+        }
+        service._make_request = AsyncMock(return_value=first_page)
+
+        with patch("app.services.notion_service.get_toggle_content", AsyncMock(return_value="내용")) as toggle:
+            result = await service.get_commit_details("page", "ABCDEF12")
+
+        assert service._make_request.await_count == 1
+        toggle.assert_awaited_once()
+        assert result.startswith("# 📅 2025-06-01 코드 분석 (abcdef12)")
+
+    @pytest.mark.asyncio
+    async def test_get_commit_details_not_found(self, service):
+        """모든 페이지를 조회해도 없으면 안내 메시지 반환"""
+        service._make_request = AsyncMock(side_effect=[
+            {"results": [_toggle("t1", "코드 분석 (11111111)")], "has_more": True, "next_cursor": "c"},
+            {"results": [_toggle("t2", "코드 분석 (22222222)")], "has_more": False},
+        ])
+
+        result = await service.get_commit_details("page", "33333333")
+
+        assert service._make_request.await_count == 2
+        assert "찾을 수 없습니다" in result
+
+    @pytest.mark.asyncio
+    async def test_get_active_database_uses_meta_cache(self, service):
+        """동일 DB 재조회 시 TTL 캐시로 Notion GET 생략"""
+        _db_meta_cache.clear()
+        service._make_request = AsyncMock(return_value={
+            "id": "db1",
+            "title": [{"text": {"content": "학습 DB"}}],
+            "parent": {"page_id": "parent1"}
+        })
+        db_info = {"db_id": "db1", "status": "used", "workspace_id": "ws1"}
+
+        first = await service.get_active_database(db_info)
+        second = await service.get_active_database(db_info)
+
+        assert service._make_request.await_count == 1
+        assert first.title == second.title == "학습 DB"
+        assert second.parent_page_id == "parent1"
+
+    @pytest.mark.asyncio
+    async def test_get_page_content_as_markdown_preserves_block_order(self, service):
+        """동시 변환 후에도 블록 순서대로 결합"""
+        blocks = [
+            {"id": "b1", "type": "heading_2", "heading_2": {"rich_text": [{"type": "text", "text": {"content": "제목"}}]}},
+            {"id": "b2", "type": "divider", "divider": {}},
+            {"id": "b3", "type": "quote", "quote": {"rich_text": [{"type": "text", "text": {"content": "인용"}}]}},
+        ]
+        service.get_page_content = AsyncMock(return_value={"blocks": blocks})
+
+        result = await service.get_page_content_as_markdown("page")
+
+        assert result == "## 제목\n\n---\n\n> 인용"
+
+    @pytest.mark.asyncio
+    async def test_update_goal_section_patches_in_place_and_deletes_surplus(self, service):
+        """기존 to_do는 내용만 수정하고 남는 to_do만 삭제"""
+        blocks = [
+            {"id": "h1", "type": "heading_2", "heading_2": {"rich_text": [{"type": "text", "text": {"content": "🧠 학습 목표"}}]}},
+            {"id": "td1", "type": "to_do", "to_do": {"rich_text": []}},
+            {"id": "td2", "type": "to_do", "to_do": {"rich_text": []}},
+            {"id": "h2", "type": "heading_2", "heading_2": {"rich_text": [{"type": "text", "text": {"content": "📑 학습 내용"}}]}},
+            {"id": "td3", "type": "to_do", "to_do": {"rich_text": []}},
+        ]
+        service._make_request = AsyncMock(return_value={"results": blocks})
+        service._patch_children_in_chunks = AsyncMock()
+
+        await service.update_goal_section("page", goals=["목표 A"])
+
+        calls = [(c.args[0], c.args[1]) for c in service._make_request.await_args_list]
+        assert ("PATCH", "blocks/td1") in calls
+        assert ("DELETE", "blocks/td2") in calls
+        assert not any(path == "blocks/td3" for _, path in calls)
+        service._patch_children_in_chunks.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_update_goal_section_appends_extra_goals_after_last_todo(self, service):
+        """목표가 늘어나면 추가분만 섹션 마지막 to_do 뒤에 삽입"""
+        blocks = [
+            {"id": "h1", "type": "heading_2", "heading_2": {"rich_text": [{"type": "text", "text": {"content": "🧠 학습 목표"}}]}},
+            {"id": "q1", "type": "quote", "quote": {"rich_text": []}},
+            {"id": "td1", "type": "to_do", "to_do": {"rich_text": []}},
+        ]
+        service._make_request = AsyncMock(return_value={"results": blocks})
+        service._patch_children_in_chunks = AsyncMock()
+
+        await service.update_goal_section("page", goals=["목표 A", "목표 B", "목표 C"])
+
+        args = service._patch_children_in_chunks.await_args
+        assert [t["to_do"]["rich_text"][0]["text"]["content"] for t in args.args[1]] == ["목표 B", "목표 C"]
+        assert args.kwargs["after"] == "td1"
+
+    @pytest.mark.asyncio
+    async def test_list_databases_in_page_cached_until_database_created(self, service):
+        """페이지 하위 DB 목록은 캐시되고, 같은 페이지에 DB 생성 시 무효화"""
+        _page_databases_cache.clear()
+        children = {"results": [{"id": "db1", "type": "child_database", "child_database": {"title": "학습 DB"}}]}
+        service._make_request = AsyncMock(return_value=children)
+
+        first = await service.list_databases_in_page("page1")
+        second = await service.list_databases_in_page("page1")
+        assert service._make_request.await_count == 1
+        assert first == second == [{"id": "db1", "title": "학습 DB"}]
+
+        service._make_request.side_effect = [{"id": "db2"}, children]
+        await service.create_database("새 DB", "page1")
+        await service.list_databases_in_page("page1")
+        assert service._make_request.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_update_database_builds_result_from_patch_response(self, service):
+        """제목 변경 시 GET 없이 PATCH 응답만으로 결과 구성"""
+        _db_meta_cache.clear()
+        service._make_request = AsyncMock(return_value={
+            "id": "db1",
+            "title": [{"text": {"content": "새 제목"}}],
+            "parent": {"page_id": "parent1"}
+        })
+
+        result = await service.update_database("db1", DatabaseUpdate(title="새 제목"))
+
+        service._make_request.assert_awaited_once()
+        assert service._make_request.await_args.args[0] == "PATCH"
+        assert result.title == "새 제목"
+        assert result.parent_page_id == "parent1"
+
+    @pytest.mark.asyncio
+    async def test_make_request_does_not_retry_client_errors(self, service):
+        """404 등 4xx 오류는 재시도 없이 NotionClientError로 즉시 실패"""
+        request = httpx.Request("GET", "https://api.notion.com/v1/pages/missing")
+        client = MagicMock()
+        client.request = AsyncMock(return_value=httpx.Response(404, text="not found", request=request))
+
+        with patch("app.services.notion_service.get_http_client", return_value=client):
+            with pytest.raises(NotionClientError) as exc_info:
+                await service._make_request("GET", "pages/missing")
+
+        assert exc_info.value.status_code == 404
+        client.request.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_make_request_serializes_json_body_with_orjson(self, service):
+        """json 인자는 bytes content로 직렬화되어 전달되고 응답은 dict로 파싱"""
+        request = httpx.Request("PATCH", "https://api.notion.com/v1/blocks/b1")
+        client = MagicMock()
+        client.request = AsyncMock(return_value=httpx.Response(200, json={"id": "b1"}, request=request))
+
+        with patch("app.services.notion_service.get_http_client", return_value=client):
+            result = await service._make_request("PATCH", "blocks/b1", json={"quote": "목표"})
+
+        sent = client.request.await_args.kwargs
+        assert "json" not in sent
+        assert sent["content"] == '{"quote":"목표"}'.encode()
+        assert result == {"id": "b1"}
+
+    @pytest.mark.asyncio
+    async def test_find_goal_section_paginates_until_section_ends(self, service):
+        """목표 섹션이 페이지 경계를 넘으면 다음 페이지까지 조회하고, 섹션이 끝나면 중단"""
+        service._make_request = AsyncMock(side_effect=[
+            {"results": [
+                {"id": "h1", "type": "heading_2", "heading_2": {"rich_text": [{"type": "text", "text": {"content": "🧠 학습 목표"}}]}},
+                {"id": "q1", "type": "quote", "quote": {"rich_text": []}},
+            ], "has_more": True, "next_cursor": "c2"},
+            {"results": [
+                {"id": "td1", "type": "to_do", "to_do": {"rich_text": []}},
+                {"id": "h2", "type": "heading_2", "heading_2": {"rich_text": [{"type": "text", "text": {"content": "📑 학습 내용"}}]}},
+            ], "has_more": True, "next_cursor": "c3"},
+        ])
+
+        quote_block, todo_blocks = await service._find_goal_section("page")
+
+        assert service._make_request.await_count == 2
+        assert service._make_request.await_args.kwargs["params"]["start_cursor"] == "c2"
+        assert quote_block["id"] == "q1"
+        assert [b["id"] for b in todo_blocks] == ["td1"]
+
+    @pytest.mark.asyncio
+    async def test_list_all_pages_maps_rows_and_defaults(self, service):
+        """행 속성 추출 및 빈 값 기본값 처리"""
+        def row(page_id, title, day, status, revisit):
+            return {"id": page_id, "properties": {
+                "학습 제목": {"title": [{"text": {"content": title}}] if title else []},
+                "날짜": {"date": {"start": day} if day else None},
+                "진행 상태": {"select": {"name": status} if status else None},
+                "복습 여부": {"checkbox": revisit},
+            }}
+        service._make_request = AsyncMock(return_value={
+            "results": [row("p1", "컴포넌트 기본", "2025-04-30", "진행중", True), row("p2", None, None, None, False)],
+            "has_more": False
+        })
+
+        pages = await service.list_all_pages("db1")
+
+        assert service._make_request.await_args.kwargs["json"] == {"page_size": 100}
+        assert pages == [
+            {"page_id": "p1", "title": "컴포넌트 기본", "date": "2025-04-30", "status": "진행중", "revisit": True},
+            {"page_id": "p2", "title": "(제목 없음)", "date": None, "status": "(상태 없음)", "revisit": False},
+        ]
+
+    @pytest.mark.asyncio
+    async def test_make_request_waits_retry_after_on_rate_limit(self, service):
+        """429 응답은 Retry-After 만큼 대기 후 재시도"""
+        request = httpx.Request("GET", "https://api.notion.com/v1/pages/p1")
+        client = MagicMock()
+        client.request = AsyncMock(side_effect=[
+            httpx.Response(429, headers={"Retry-After": "0.5"}, text="rate limited", request=request),
+            httpx.Response(200, json={"id": "p1"}, request=request),
+        ])
+
+        with patch("app.services.notion_service.get_http_client", return_value=client), \
+             patch("app.utils.retry.asyncio.sleep", AsyncMock()) as sleep:
+            result = await service._make_request("GET", "pages/p1")
+
+        assert result == {"id": "p1"}
+        # 재시도 대기는 Retry-After 값 (이후 대기는 같은 토큰 버킷의 남은 보류 시간)
+        assert sleep.await_args_list[0].args == (0.5,)
+        assert service._limiter._blocked_until > 0
+
+    @pytest.mark.asyncio
+    async def test_list_all_pages_follows_cursors(self, service):
+        """has_more가 false가 될 때까지 next_cursor로 이어서 조회"""
+        row = {"id": "p", "properties": {
+            "학습 제목": {"title": []}, "날짜": {"date": None},
+            "진행 상태": {"select": None}, "복습 여부": {"checkbox": False},
+        }}
+        service._make_request = AsyncMock(side_effect=[
+            {"results": [row], "has_more": True, "next_cursor": "c2"},
+            {"results": [row, row], "has_more": False},
+        ])
+
+        pages = await service.list_all_pages("db1")
+
+        assert len(pages) == 3
+        assert service._make_request.await_args_list[1].kwargs["json"] == {"page_size": 100, "start_cursor": "c2"}
+
+    @pytest.mark.asyncio
+    async def test_list_all_pages_mapping_error_cancels_and_awaits_prefetch(self, service):
+        """행 변환이 실패하면 진행 중인 다음 페이지 조회를 취소하고 끝날 때까지 기다린 뒤 예외 전파"""
+        import asyncio
+        tasks = []
+        create_task = asyncio.create_task
+
+        def track_task(coro):
+            task = create_task(coro)
+            tasks.append(task)
+            return task
+
+        async def fake_request(method, path, json=None):
+            if "start_cursor" not in json:
+                return {"results": [{"id": "broken"}], "has_more": True, "next_cursor": "c2"}
+            await asyncio.sleep(1)
+            return {"results": [], "has_more": False}
+
+        service._make_request = fake_request
+
+        with patch("app.services.notion_service.asyncio.create_task", side_effect=track_task), \
+             pytest.raises(KeyError):
+            await service.list_all_pages("db1")
+
+        assert len(tasks) == 1 and tasks[0].cancelled()
+
+    @pytest.mark.asyncio
+    async def test_get_page_content_uses_redis_cache_when_enabled(self):
+        """redis_client 주입 + use_cache일 때 두 번째 조회는 Notion 호출 생략, 블록 추가 시 무효화"""
+        store = {}
+        redis_client = MagicMock()
+        redis_client.get = AsyncMock(side_effect=store.get)
+        redis_client.set = AsyncMock(side_effect=lambda key, value, ex=None: store.__setitem__(key, value) or True)
+        redis_client.delete = AsyncMock(side_effect=lambda key: 1 if store.pop(key, None) is not None else 0)
+
+        service = NotionService(token="test_token", redis_client=redis_client)
+        service._make_request = AsyncMock(return_value={"results": [{"id": "b1"}], "has_more": False})
+
+        first = await service.get_page_content("page", use_cache=True)
+        second = await service.get_page_content("page", use_cache=True)
+        assert first == second == {"blocks": [{"id": "b1"}]}
+        assert service._make_request.await_count == 1
+
+        await service._patch_children_in_chunks("page", [{"type": "divider"}], 50, 0)
+        await service.get_page_content("page", use_cache=True)
+        assert service._make_request.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_append_code_analysis_invalidates_page_content_cache(self):
+        """코드 분석 토글 추가 후 페이지 본문 캐시를 다시 조회"""
+        redis_client = MagicMock()
+        redis_client.delete = AsyncMock(return_value=1)
+        service = NotionService(token="test_token", redis_client=redis_client)
+        service._make_request = AsyncMock(return_value={"results": [{"id": "toggle"}]})
+
+        await service.append_code_analysis_to_page("page", "- 요약", "abcdef1234")
+
+        redis_client.delete.assert_any_await(service._page_content_cache_key("page"))
+
+    @pytest.mark.asyncio
+    async def test_delete_page_invalidates_page_content_cache(self):
+        """페이지 삭제 후에는 캐시된 본문 대신 Notion에서 다시 조회"""
+        store = {}
+        redis_client = MagicMock()
+        redis_client.get = AsyncMock(side_effect=store.get)
+        redis_client.set = AsyncMock(side_effect=lambda key, value, ex=None: store.__setitem__(key, value) or True)
+        redis_client.delete = AsyncMock(side_effect=lambda key: int(store.pop(key, None) is not None))
+        service = NotionService(token="test_token", redis_client=redis_client)
+        service._make_request = AsyncMock(return_value={"results": [{"type": "paragraph"}], "has_more": False})
+
+        await service.get_page_content("page", use_cache=True)
+        assert service._page_content_cache_key("page") in store
+
+        await service.delete_page("page")
+
+        assert service._page_content_cache_key("page") not in store
+
+    @pytest.mark.asyncio
+    async def test_create_learning_pages_keeps_order_and_isolates_failures(self, service):
+        """일괄 생성은 입력 순서대로 결과를 반환하고, 실패한 페이지는 예외 객체로 반환"""
+        async def fake_create(database_id, plan, key):
+            if plan == "bad":
+                raise NotionClientError("실패", 400)
+            return f"page-{plan}", f"log-{key}"
+
+        service.create_learning_page = AsyncMock(side_effect=fake_create)
+
+        results = await service.create_learning_pages("db1", ["a", "bad", "c"], ["k1", "k2", "k3"])
+
+        assert results[0] == ("page-a", "log-k1")
+        assert isinstance(results[1], NotionClientError)
+        assert results[2] == ("page-c", "log-k3")
+
+    @pytest.mark.asyncio
+    async def test_db_meta_is_shared_through_redis(self):
+        """로컬 캐시가 비어도 Redis에 저장된 메타가 있으면 Notion GET 생략"""
+        store = {}
+        redis_client = MagicMock()
+        redis_client.get = AsyncMock(side_effect=store.get)
+        redis_client.set = AsyncMock(side_effect=lambda key, value, ex=None: store.__setitem__(key, value) or True)
+
+        service = NotionService(token="test_token", redis_client=redis_client)
+        service._make_request = AsyncMock(return_value={
+            "id": "db1",
+            "title": [{"text": {"content": "학습 DB"}}],
+            "parent": {"page_id": "parent1"},
+        })
+
+        _db_meta_cache.clear()
+        await service._fetch_db_meta("db1")
+        _db_meta_cache.clear()
+        meta = await service._fetch_db_meta("db1")
+
+        assert meta == {"title": "학습 DB", "parent_page_id": "parent1"}
+        assert service._make_request.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_comprehensive_update_orders_body_and_overlaps_props(self, service):
+        """속성 PATCH는 본문 수정과 동시에 진행되고, 본문은 목표 섹션 → 요약 순서로 진행"""
+        import asyncio
+        events = []
+        goal_started = asyncio.Event()
+
+        async def update_props(*args):
+            # 본문 수정이 시작되기를 기다림 (순차 실행이면 여기서 시간 초과)
+            await asyncio.wait_for(goal_started.wait(), timeout=1)
+            events.append("props")
+
+        async def update_goal(*args):
+            goal_started.set()
+            await asyncio.sleep(0)
+            events.append("goal")
+
+        async def update_summary(*args):
+            events.append("summary")
+
+        service.update_page_properties = AsyncMock(side_effect=update_props)
+        service.update_goal_section = AsyncMock(side_effect=update_goal)
+        service.update_ai_summary_by_page = AsyncMock(side_effect=update_summary)
+
+        await service.update_learning_page_comprehensive(
+            "page", props={"x": 1}, goal_intro="intro", goals=["g"], summary="# s"
+        )
+
+        assert sorted(events) == ["goal", "props", "summary"]
+        assert events.index("goal") < events.index("summary")
+
+    @pytest.mark.asyncio
+    async def test_comprehensive_update_failure_keeps_applied_and_cancels_rest(self, service):
+        """한 업데이트가 실패하면 예외를 전파하고, 이미 반영된 업데이트는 남기고 진행 중인 업데이트는 취소"""
+        import asyncio
+        events = []
+        goal_done = asyncio.Event()
+
+        async def update_props(*args):
+            await asyncio.wait_for(goal_done.wait(), timeout=1)
+            raise NotionClientError("속성 업데이트 실패", 400)
+
+        async def update_goal(*args):
+            events.append("goal")
+            goal_done.set()
+
+        async def update_summary(*args):
+            try:
+                await asyncio.sleep(1)
+            except asyncio.CancelledError:
+                events.append("summary-cancelled")
+                raise
+            events.append("summary")
+
+        service.update_page_properties = AsyncMock(side_effect=update_props)
+        service.update_goal_section = AsyncMock(side_effect=update_goal)
+        service.update_ai_summary_by_page = AsyncMock(side_effect=update_summary)
+
+        with pytest.raises(NotionClientError):
+            await service.update_learning_page_comprehensive(
+                "page", props={"x": 1}, goal_intro="intro", goals=["g"], summary="# s"
+            )
+
+        # 목표 섹션은 롤백 없이 반영된 상태로 남고, 요약 추가는 완료되지 않음
+        assert events == ["goal", "summary-cancelled"]
+
+    @pytest.mark.asyncio
+    async def test_http_client_rebind_closes_previous_client(self):
+        """루프가 바뀌어 클라이언트를 새로 만들 때 이전 루프의 클라이언트를 닫음"""
+        import asyncio
+        import threading
+        from app.services import notion_service
+
+        other_loop = asyncio.new_event_loop()
+        thread = threading.Thread(target=other_loop.run_forever, daemon=True)
+        thread.start()
+        try:
+            async def _get():
+                return notion_service.get_http_client()
+
+            old_client = asyncio.run_coroutine_threadsafe(_get(), other_loop).result(timeout=1)
+            new_client = notion_service.get_http_client()
+
+            assert new_client is not old_client
+            for _ in range(50):
+                if old_client.is_closed:
+                    break
+                await asyncio.sleep(0.01)
+            assert old_client.is_closed
+        finally:
+            await notion_service.close_http_client()
+            other_loop.call_soon_threadsafe(other_loop.stop)
+            thread.join(timeout=1)
+            other_loop.close()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_share_cache_lock(self):
+        """요청마다 서비스 객체가 새로 만들어져도 같은 페이지의 동시 조회는 Notion GET 한 번만 수행"""
+        import asyncio
+        from app.services import notion_service
+        _page_databases_cache.clear()
+        calls = 0
+
+        async def fake_request(*args, **kwargs):
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return {"results": []}
+
+        services = [NotionService(token="test_token") for _ in range(3)]
+        for s in services:
+            s._make_request = fake_request
+
+        await asyncio.gather(*(s.list_databases_in_page("page1") for s in services))
+
+        assert calls == 1
+        assert len(notion_service._cache_locks) == 0
+
+    @pytest.mark.asyncio
+    async def test_markdown_conversion_failure_cancels_sibling_conversions(self, service):
+        """블록 하나의 변환이 실패하면 나머지 블록 변환(하위 블록 조회)은 취소"""
+        import asyncio
+        cancelled = []
+
+        async def fake_convert(block, request):
+            if block["id"] == "bad":
+                raise NotionAPIError("하위 블록 조회 실패")
+            try:
+                await asyncio.sleep(1)
+            except asyncio.CancelledError:
+                cancelled.append(block["id"])
+                raise
+            return block["id"]
+
+        blocks = [{"id": "slow", "type": "paragraph"}, {"id": "bad", "type": "paragraph"}]
+        service.get_page_content = AsyncMock(return_value={"blocks": blocks})
+
+        with patch("app.services.notion_service.convert_block_to_markdown", side_effect=fake_convert):
+            result = await service.get_page_content_as_markdown("page")
+
+        assert "오류" in result
+        assert cancelled == ["slow"]
@@ -0,0 +1,25 @@
+"""
+notion_utils 블록 변환 유틸리티 테스트
+"""
+from app.utils.notion_utils import block_content
+
+
+def _block(btype: str, data: dict, block_id: str = "b1") -> dict:
+    return {"id": block_id, "type": btype, "has_children": False, btype: data}
+
+
+def test_block_content_extracts_type_specific_fields():
+    """to_do는 checked, code는 lang까지 추출하고 그 외 타입은 빈 텍스트"""
+    rt = [{"type": "text", "text": {"content": "내용"}}]
+
+    assert block_content(_block("heading_2", {"rich_text": rt}))["text"] == "내용"
+    assert block_content(_block("to_do", {"rich_text": rt, "checked": True})) == {
+        "id": "b1", "type": "to_do", "children": False, "text": "내용", "checked": True
+    }
+    assert block_content(_block("code", {"rich_text": rt, "language": "python"}))["lang"] == "python"
+    assert block_content(_block("divider", {}))["text"] == ""
+
+
+def test_block_content_handles_empty_rich_text():
+    """rich_text가 비어 있는 블록도 IndexError 없이 빈 텍스트로 처리"""
+    assert block_content(_block("quote", {"rich_text": []}))["text"] == ""
@@ -0,0 +1,35 @@
+"""
+TokenBucket 속도 제한 유틸리티 테스트
+"""
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from app.utils.rate_limiter import TokenBucket
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_allows_burst_then_spaces_requests():
+    """capacity만큼은 바로 통과하고, 이후 요청은 1/rate 간격으로 대기"""
+    bucket = TokenBucket(rate=2.0, capacity=2)
+
+    with patch("app.utils.rate_limiter.time.monotonic", return_value=100.0), \
+         patch("app.utils.rate_limiter.asyncio.sleep", AsyncMock()) as sleep:
+        bucket._updated = 100.0
+        for _ in range(4):
+            await bucket.acquire()
+
+    assert [c.args[0] for c in sleep.await_args_list] == [0.5, 1.0]
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_pause_blocks_until_retry_after():
+    """pause 이후에는 토큰이 남아 있어도 보류 시간이 끝날 때까지 대기"""
+    bucket = TokenBucket(rate=3.0, capacity=3)
+
+    with patch("app.utils.rate_limiter.time.monotonic", return_value=50.0), \
+         patch("app.utils.rate_limiter.asyncio.sleep", AsyncMock()) as sleep:
+        bucket._updated = 50.0
+        bucket.pause(2.0)
+        await bucket.acquire()
+
+    sleep.assert_awaited_once_with(2.0)
@@ -0,0 +1,90 @@
+"""
+RedisService 단위 테스트 (redis.asyncio 클라이언트는 모킹)
+"""
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from app.services.redis_service import RedisService
+
+
+@pytest.fixture
+def redis_service():
+    return RedisService()
+
+
+@pytest.mark.asyncio
+async def test_mset_json_sends_all_keys_in_one_pipeline(redis_service):
+    """여러 키를 하나의 파이프라인 execute로 저장"""
+    pipe = MagicMock()
+    pipe.execute = AsyncMock(return_value=[True, True])
+    pipe.__aenter__ = AsyncMock(return_value=pipe)
+    pipe.__aexit__ = AsyncMock(return_value=False)
+    redis_client = MagicMock()
+    redis_client.pipeline.return_value = pipe
+
+    result = await redis_service.mset_json({"a": [1], "b": {"x": 1}}, redis_client, expire_seconds=60)
+
+    assert result is True
+    redis_client.pipeline.assert_called_once_with(transaction=False)
+    assert pipe.set.call_count == 2
+    pipe.set.assert_any_call("a", b"[1]", ex=60)
+    pipe.execute.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_mget_json_decodes_hits_and_keeps_misses(redis_service):
+    """MGET 결과 중 없는 키는 None 유지"""
+    redis_client = MagicMock()
+    redis_client.mget = AsyncMock(return_value=['{"x":1}', None])
+
+    assert await redis_service.mget_json(["a", "b"], redis_client) == [{"x": 1}, None]
+
+
+@pytest.mark.asyncio
+async def test_validate_state_uuid_consumes_state_atomically(redis_service):
+    """GETDEL 한 번으로 조회+삭제하고, 일치 여부만 반환"""
+    redis_client = MagicMock()
+    redis_client.getdel = AsyncMock(side_effect=["state-1", None])
+
+    assert await redis_service.validate_state_uuid("user", "state-1", redis_client) is True
+    assert await redis_service.validate_state_uuid("user", "state-1", redis_client) is False
+    redis_client.getdel.assert_awaited_with("as:user")
+
+
+@pytest.mark.asyncio
+async def test_get_user_context_reads_workspace_and_token_in_one_call(redis_service):
+    """워크스페이스 ID와 노션 토큰을 MGET 한 번으로 조회"""
+    redis_client = MagicMock()
+    redis_client.mget = AsyncMock(return_value=["ws-1", None])
+
+    context = await redis_service.get_user_context("user", redis_client)
+
+    assert context == {"workspace_id": "ws-1", "notion_token": None}
+    redis_client.mget.assert_awaited_once_with("user:user:workspace", "u:user:tk:notion")
+
+
+def test_redis_keys_hash_unbounded_parts():
+    """API 키와 커밋 SHA/파일 경로는 키 이름에 원문 대신 고정 길이 해시로 포함"""
+    from app.services import redis_keys
+
+    api_key_key = redis_keys.user_id_by_api_key("secret-api-key")
+    func_key = redis_keys.func_analysis("u1", "a" * 40, "src/very/long/path/module.py", "handler")
+
+    assert "secret-api-key" not in api_key_key
+    assert func_key.startswith("fa:u1:") and len(func_key) == len("fa:u1:") + 16
+    assert func_key == redis_keys.func_analysis("u1", "a" * 40, "src/very/long/path/module.py", "handler")
+
+    hash_key = redis_keys.func_summaries("u1", "a" * 40, "src/very/long/path/module.py")
+    assert hash_key.startswith("fh:u1:") and "module.py" not in hash_key
+    assert redis_keys.pending_count("u1", "a" * 40, "src/very/long/path/module.py") != hash_key
+
+
+@pytest.mark.asyncio
+async def test_set_state_uuid_keeps_in_flight_state(redis_service):
+    """이미 진행 중인 state가 있으면 새로 덮어쓰지 않고 기존 값을 반환"""
+    redis_client = MagicMock()
+    redis_client.set = AsyncMock(return_value=None)
+    redis_client.get = AsyncMock(return_value="existing-state")
+
+    assert await redis_service.set_state_uuid("user", redis_client) == "existing-state"
+    assert redis_client.set.await_args.kwargs["nx"] is True
@@ -0,0 +1,162 @@
+"""
+supa 쿼리 헬퍼 단위 테스트 (Supabase 클라이언트는 모킹)
+"""
+import pytest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from app.services import supa
+
+
+def _query(data):
+    """select/eq/... 체인은 자기 자신을 반환하고 execute만 결과를 돌려주는 쿼리 모킹"""
+    query = MagicMock()
+    for name in ("select", "eq", "lt", "order", "limit", "insert", "update", "single", "maybe_single"):
+        getattr(query, name).return_value = query
+    query.execute = AsyncMock(return_value=SimpleNamespace(data=data))
+    return query
+
+
+@pytest.mark.asyncio
+async def test_activate_database_swaps_with_single_rpc():
+    """기존 활성 DB 해제 + 새 DB 활성화를 RPC 한 번으로 처리"""
+    supabase = MagicMock()
+    supabase.table.return_value = _query([{"id": 7}])
+    supabase.rpc.return_value = _query([{"ok": True}])
+
+    assert await supa.activate_database("new-db", supabase, "ws") is True
+
+    supabase.rpc.assert_called_once_with("activate_db_transaction", {
+        "workspace_id": "ws",
+        "old_rec_id": 7,
+        "new_db_id": "new-db",
+    })
+
+
+@pytest.mark.asyncio
+async def test_get_ai_block_id_returns_first_row_or_none():
+    """중복 행이 있어도 첫 행을 반환하고(limit 1), 행이 없으면 None"""
+    query = _query([{"ai_block_id": "b1"}])
+    supabase = MagicMock()
+    supabase.table.return_value = query
+
+    assert await supa.get_ai_block_id_by_page_id("page", "ws", supabase) == "b1"
+    query.limit.assert_called_once_with(1)
+
+    query.execute = AsyncMock(return_value=SimpleNamespace(data=[]))
+    assert await supa.get_ai_block_id_by_page_id("page", "ws", supabase) is None
+
+
+@pytest.mark.asyncio
+async def test_get_db_info_by_id_selects_only_consumed_columns():
+    """SELECT * 대신 응답에 쓰는 컬럼만 조회하고 첫 행을 반환"""
+    row = {"db_id": "db", "status": "ready"}
+    query = _query([row])
+    supabase = MagicMock()
+    supabase.table.return_value = query
+
+    assert await supa.get_db_info_by_id("db", supabase, "ws") == row
+    assert "*" not in query.select.call_args.args[0]
+
+
+@pytest.mark.asyncio
+async def test_get_databases_in_page_uses_shared_notion_client():
+    """페이지 하위 DB 조회는 요청마다 새 클라이언트를 만들지 않고 공용 클라이언트 사용"""
+    response = MagicMock()
+    response.json.return_value = {"results": [
+        {"type": "child_database", "id": "db1", "child_database": {"title": "DB"}},
+        {"type": "paragraph", "id": "p1"},
+    ]}
+    client = MagicMock()
+    client.get = AsyncMock(return_value=response)
+
+    with patch("app.services.supa.get_notion_http_client", return_value=client), \
+         patch("app.services.supa.settings"):
+        databases = await supa.get_databases_in_page("page", MagicMock())
+
+    assert [db["id"] for db in databases] == ["db1"]
+    client.get.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_used_db_id_cached_until_status_changes():
+    """사용 중인 DB ID는 로컬 캐시에서 재사용하고, 상태 변경 시 무효화"""
+    supa._used_db_cache.clear()
+    query = _query([{"db_id": "db1", "id": 1}])
+    supabase = MagicMock()
+    supabase.table.return_value = query
+    supabase.rpc.return_value = _query([{"ok": True}])
+
+    assert await supa.get_used_notion_db_id(supabase, "ws") == "db1"
+    assert await supa.get_used_notion_db_id(supabase, "ws") == "db1"
+    assert query.execute.await_count == 1
+
+    await supa.update_learning_database_status("db2", "used", supabase, "ws")
+    assert "ws" not in supa._used_db_cache
+
+
+@pytest.mark.asyncio
+async def test_auth_user_uses_admin_api():
+    """get_user_by_id 결과(user)를 dict로 반환 (토큰 폐기가 바로 반영되도록 캐시하지 않음)"""
+    user = MagicMock()
+    user.model_dump.return_value = {"id": "u1"}
+    supabase = MagicMock()
+    supabase.auth.admin.get_user_by_id = AsyncMock(return_value=SimpleNamespace(user=user))
+
+    assert await supa.auth_user("u1", "token", supabase) == {"id": "u1"}
+    supabase.auth.admin.get_user_by_id.assert_awaited_once_with("u1")
+
+
+@pytest.mark.asyncio
+async def test_webhook_info_cached_until_updated():
+    """웹훅 정보는 TTL 동안 재사용하고 update_webhook_info 후 다시 조회"""
+    supa._webhook_info_cache.clear()
+    query = _query([{"webhook_id": "w1", "webhook_status": "active"}])
+    supabase = MagicMock()
+    supabase.table.return_value = query
+
+    assert await supa.get_webhook_info("db1", supabase) == {"webhook_id": "w1", "webhook_status": "active"}
+    assert await supa.get_webhook_info_by_db_id("db1", supabase) == {"webhook_id": "w1", "webhook_status": "active"}
+    assert query.execute.await_count == 1
+
+    query.execute = AsyncMock(return_value=SimpleNamespace(data=[{"db_id": "db1"}]))
+    await supa.update_webhook_info("db1", "w2", supabase)
+    assert "db1" not in supa._webhook_info_cache
+
+
+@pytest.mark.asyncio
+async def test_used_db_id_invalidated_on_deactivate_even_if_rpc_fails():
+    """비활성화 RPC가 실패해도 캐시된 사용 중 DB ID는 무효화"""
+    supa._used_db_cache.set("ws", "db1")
+    supabase = MagicMock()
+    supabase.table.return_value = _query([{"id": 1}])
+    rpc_query = _query(None)
+    rpc_query.execute = AsyncMock(side_effect=RuntimeError("boom"))
+    supabase.rpc.return_value = rpc_query
+
+    with pytest.raises(supa.DatabaseError):
+        await supa.deactivate_database("db1", supabase, "ws")
+    assert "ws" not in supa._used_db_cache
+
+
+@pytest.mark.asyncio
+async def test_used_db_id_reloaded_after_workspace_switch():
+    """워크스페이스 전환 후에는 캐시된 이전 DB가 아닌 DB에서 다시 조회"""
+    supa._used_db_cache.clear()
+    supa._webhook_info_cache.set("db1", {"webhook_id": "w1"})
+    query = _query([{"db_id": "db1", "id": 1}])
+    supabase = MagicMock()
+    supabase.table.return_value = query
+    supabase.rpc.return_value = _query([{"ok": True}])
+
+    assert await supa.get_used_notion_db_id(supabase, "ws") == "db1"
+
+    await supa.switch_active_workspace("u1", SimpleNamespace(workspace_id="ws2"), supabase)
+    query.execute = AsyncMock(return_value=SimpleNamespace(data=[]))
+
+    assert await supa.get_used_notion_db_id(supabase, "ws") is None
+    assert "db1" not in supa._webhook_info_cache
+
+    supa._used_db_cache.set("ws", "db1")
+    await supa.deactivate_all_workspaces("u1", supabase)
+    assert "ws" not in supa._used_db_cache
@@ -0,0 +1,29 @@
+"""
+TTLCache 유틸리티 테스트
+"""
+from unittest.mock import patch
+
+from app.utils.ttl_cache import TTLCache
+
+
+def test_ttl_cache_expires_on_read():
+    """TTL이 지난 항목은 조회 시 제거"""
+    cache = TTLCache(maxsize=10, ttl=5)
+    with patch("app.utils.ttl_cache.time.monotonic", return_value=100.0):
+        cache.set("a", 1)
+        assert cache.get("a") == 1
+    with patch("app.utils.ttl_cache.time.monotonic", return_value=105.0):
+        assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_ttl_cache_evicts_least_recently_used_over_maxsize():
+    """maxsize를 넘으면 가장 오래 사용되지 않은 항목부터 제거"""
+    cache = TTLCache(maxsize=2, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert "b" not in cache
+    assert cache.get("a") == 1 and cache.get("c") == 3
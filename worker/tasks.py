@@ -6,6 +6,7 @@ from typing import Dict, List
 from rq import Queue, SimpleWorker, Worker, SpawnWorker, get_current_job
 from rq.timeouts import TimerDeathPenalty
 from app.services.code_analysis_service import CodeAnalysisService
+from app.services.notion_service import close_http_client as close_notion_http_client
 from app.core.config import settings
 from worker.config import RQ_CONFIG
 from app.utils.logger import api_logger
@@ -141,6 +142,11 @@ async def _analyze_code_async(files: List[Dict], owner: str, repo: str, commit_s
         except Exception as cleanup_error:
             api_logger.error(f"ThreadPoolExecutor 정리 실패: {cleanup_error}")
             api_logger.error(traceback.format_exc())
+        # Notion HTTP 클라이언트는 이 작업의 이벤트 루프에 묶여 있으므로 루프가 끝나기 전에 닫음
+        try:
+            await close_notion_http_client()
+        except Exception as cleanup_error:
+            api_logger.error(f"Notion HTTP 클라이언트 정리 실패: {cleanup_error}")
 
 def create_optimized_worker():
     """OS별 최적화된 워커 생성"""